@@ -180,6 +180,7 @@ for i, curRadius in enumerate(radiusVec[local_range[0] : local_range[1]]):
             modelCur.mpi_comm_world, str(result_folder / f"{species_name}.xdmf")
         )
         results[species_name].parameters["flush_output"] = True
+        results[species_name].parameters["rewrite_function_mesh"] = False
         results[species_name].write(modelCur.sc[species_name].u["u"], modelCur.t)
 
     # Solve
@@ -1,5 +1,5 @@
-from . import config
-from . import common, mesh, model, model_assembly, solvers, units, mesh_tools
+import importlib as _importlib
+import typing as _typing
 
 __all__ = [
     "config",
@@ -11,3 +11,22 @@ __all__ = [
     "units",
     "mesh_tools",
 ]
+
+if _typing.TYPE_CHECKING:
+    from . import config, common, mesh, model, model_assembly, solvers, units, mesh_tools  # noqa
+
+
+def __getattr__(name):
+    # Submodules pull in dolfin, petsc4py and friends, so they are only
+    # imported the first time they are accessed (PEP 562)
+    if name in __all__:
+        module = _importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    # hide the private helpers imported above, as the eager imports never exposed them
+    public = {name for name in globals() if not name.startswith("_") or name.startswith("__")}
+    return sorted(public | set(__all__))
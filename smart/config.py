@@ -353,6 +353,9 @@ class SolverConfig(BaseConfig):
         dt_increase_factor:
         attempt_timestep_restart_on_divergence: Restart snes solver if it diverges
         reset_timestep_for_negative_solution: Reduce solver timestep is solution is negative
+        form_compiler_optimize_flags: Flags passed to the C++ compiler when dolfin
+            JIT compiles the variational forms of the model. They are set per form,
+            so the global ``dolfin.parameters["form_compiler"]`` are not changed
     """
 
     final_t: Optional[float] = None
@@ -363,6 +366,7 @@ class SolverConfig(BaseConfig):
     time_precision: int = 6
     attempt_timestep_restart_on_divergence: bool = False
     reset_timestep_for_negative_solution: bool = False
+    form_compiler_optimize_flags: str = "-O3"
 
 
 @dataclass
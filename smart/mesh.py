@@ -1,8 +1,10 @@
 """
 Wrapper around dolfin mesh class to define parent and child meshes for SMART simulations.
 """
-from typing import Dict, FrozenSet
+from typing import Dict, FrozenSet, Optional, Union
+import hashlib
 import logging
+import pathlib
 
 import dolfin as d
 import numpy as np
@@ -142,11 +144,14 @@ class ParentMesh(_Mesh):
     on marker values from the .hdf5 or .xml file.
 
     Args:
-        mesh_filename (str): Name of mesh file
+        mesh_filename (str or pathlib.Path): Name of mesh file
         mesh_filetype (str): Extension of mesh, either 'xml' or 'hdf5'
         parent_mesh (str): Name of mesh
         use_partition (bool): If `hdf5` mesh file is loaded,
           choose if mesh should be read in with its current partition
+        cache_dir (str or pathlib.Path, optional): If set and an `xml` mesh file is
+          loaded, keep an hdf5 copy of the mesh in this folder and read that copy
+          on later loads
     """
 
     mesh_filename: str
@@ -157,21 +162,27 @@ class ParentMesh(_Mesh):
 
     def __init__(
         self,
-        mesh_filename: str,
+        mesh_filename: Union[str, pathlib.Path],
         mesh_filetype,
         name,
         use_partition=False,
         mpi_comm=d.MPI.comm_world,
+        cache_dir: Optional[Union[str, pathlib.Path]] = None,
     ):
         super().__init__(name)
         self.use_partition = use_partition
         self.mpi_comm = mpi_comm
+        # dolfin only accepts filenames as strings
+        mesh_filename = str(mesh_filename)
+        self.mesh_filename = mesh_filename
+        self.mesh_filetype = mesh_filetype
+        # file the mesh functions are read from (the hdf5 copy if an xml mesh was cached)
+        self._mf_filename = mesh_filename
+        self._mf_filetype = mesh_filetype
         if mesh_filetype == "xml":
-            self.load_mesh_from_xml(mesh_filename)
+            self.load_mesh_from_xml(mesh_filename, cache_dir=cache_dir)
         elif mesh_filetype == "hdf5":
             self.load_mesh_from_hdf5(mesh_filename, use_partition)
-        self.mesh_filename = mesh_filename
-        self.mesh_filetype = mesh_filetype
 
         self.child_meshes = dict()
         self.parent_mesh = self
@@ -187,16 +198,84 @@ class ParentMesh(_Mesh):
     def all_meshes(self):
         return dict(list(self.child_meshes.items()) + list({self.name: self}.items()))
 
-    def load_mesh_from_xml(self, mesh_filename):
-        "Load parent mesh from xml file `mesh_filename`"
+    def load_mesh_from_xml(self, mesh_filename, cache_dir=None):
+        """
+        Load parent mesh from xml file `mesh_filename`.
+
+        If `cache_dir` is set, the xml file is converted to an hdf5 file in `cache_dir`
+        the first time it is loaded. Later loads read the hdf5 file instead of parsing
+        the xml, as long as it is newer than the xml file.
+        """
+        cache_filename = None
+        if cache_dir is not None:
+            cache_filename = self._xml_cache_filename(mesh_filename, cache_dir)
+            if self._is_xml_cache_valid(mesh_filename, cache_filename):
+                self._mf_filename = str(cache_filename)
+                self._mf_filetype = "hdf5"
+                self.load_mesh_from_hdf5(self._mf_filename)
+                return
+
         self.dolfin_mesh = d.Mesh(mesh_filename)
 
         self.dimensionality = self.dolfin_mesh.topology().dim()
         self.dolfin_mesh.init(self.dimensionality - 1)
         self.dolfin_mesh.init(self.dimensionality - 1, self.dimensionality)
-        self.dolfin_mesh.init(self.dimensionality - 1, self.dimensionality)
 
         logger.info(f'XML mesh, "{self.name}", successfully loaded from file: {mesh_filename}!')
+        if cache_filename is not None:
+            self._write_xml_cache(cache_filename)
+
+    def _xml_cache_filename(self, mesh_filename, cache_dir) -> pathlib.Path:
+        "Name of the hdf5 copy of an xml mesh (keyed on the full path of the xml file)"
+        mesh_path = pathlib.Path(mesh_filename).resolve()
+        key = hashlib.sha1(str(mesh_path).encode()).hexdigest()[:16]
+        return pathlib.Path(cache_dir) / f"{mesh_path.stem}-{key}.h5"
+
+    def _is_xml_cache_valid(self, mesh_filename, cache_filename):
+        "Check (on the root process) if the hdf5 copy of an xml mesh is up to date"
+        is_valid = None
+        if self.mpi_comm.rank == 0:
+            is_valid = (
+                cache_filename.is_file()
+                and cache_filename.stat().st_mtime >= pathlib.Path(mesh_filename).stat().st_mtime
+            )
+        return self.mpi_comm.bcast(is_valid, root=0)
+
+    def _write_xml_cache(self, cache_filename):
+        """
+        Write the mesh and the cell and facet markers of an xml mesh to `cache_filename`.
+        The file is written under a temporary name and moved into place when complete,
+        so an interrupted write is never picked up as a valid cache.
+        """
+        tmp_filename = cache_filename.with_name(f"{cache_filename.stem}.tmp.h5")
+        dim = self.dimensionality
+        if self.mpi_comm.rank == 0:
+            cache_filename.parent.mkdir(parents=True, exist_ok=True)
+        self.mpi_comm.Barrier()
+        failed = 0
+        try:
+            # the file is closed before it is moved into place (or removed), also on errors
+            with d.HDF5File(self.mpi_comm, str(tmp_filename), "w") as hdf5:
+                hdf5.write(self.dolfin_mesh, "/mesh")
+                for mf_dim in (dim, dim - 1):
+                    mf = d.MeshFunction(
+                        "size_t", self.dolfin_mesh, mf_dim, value=self.dolfin_mesh.domains()
+                    )
+                    hdf5.write(mf, f"/mf{mf_dim}")
+        except RuntimeError:
+            failed = 1
+        # every rank has to agree before the file is moved into place (or removed)
+        written = self.mpi_comm.allreduce(failed) == 0
+        if self.mpi_comm.rank == 0:
+            if written:
+                tmp_filename.replace(cache_filename)
+            else:
+                tmp_filename.unlink(missing_ok=True)
+        self.mpi_comm.Barrier()
+        if not written:
+            logger.warning(f"Could not write hdf5 copy of xml mesh to {cache_filename}")
+            return
+        logger.info(f'Wrote hdf5 copy of mesh "{self.name}" to {cache_filename}')
 
     def load_mesh_from_hdf5(self, mesh_filename, use_partition=False):
         """
@@ -220,13 +299,13 @@ class ParentMesh(_Mesh):
         logger.info(f'HDF5 mesh, "{self.name}", successfully loaded from file: {mesh_filename}!')
 
     def _read_parent_mesh_function_from_file(self, dim):
-        if self.mesh_filetype == "xml":
+        if self._mf_filetype == "xml":
             mf = d.MeshFunction("size_t", self.dolfin_mesh, dim, value=self.dolfin_mesh.domains())
-        elif self.mesh_filetype == "hdf5":
+        elif self._mf_filetype == "hdf5":
             mf = d.MeshFunction("size_t", self.dolfin_mesh, dim, value=0)
             # with d.HDF5File(self.dolfin_mesh.mpi_comm(), self.mesh_filename, 'r') as hdf5:
             # hdf5.read(mf, f'/mesh/{dim}')
-            hdf5 = d.HDF5File(self.dolfin_mesh.mpi_comm(), self.mesh_filename, "r")
+            hdf5 = d.HDF5File(self.dolfin_mesh.mpi_comm(), self._mf_filename, "r")
             hdf5.read(mf, f"/mf{dim}")
             if self.dolfin_mesh.mpi_comm().size > 1:
                 d.MPI.comm_world.Barrier()
@@ -271,19 +350,14 @@ class ParentMesh(_Mesh):
         ):
             self.mf["facets_uncombined"] = self._read_parent_mesh_function_from_file(surface_dim)
 
-        # Combine markers in a list
+        # Combine markers in a list (one pass over the mesh function per child mesh)
         for child_mesh in self.child_meshes.values():
             if child_mesh.marker_list is None:
                 continue
-            for marker in child_mesh.marker_list:
-                if not child_mesh.is_surface:
-                    self.mf["cells"].array()[
-                        self.mf["cells_uncombined"].array() == marker
-                    ] = child_mesh.primary_marker
-                if child_mesh.is_surface:
-                    self.mf["facets"].array()[
-                        self.mf["facets_uncombined"].array() == marker
-                    ] = child_mesh.primary_marker
+            mf_type = "facets" if child_mesh.is_surface else "cells"
+            combined = self.mf[mf_type].array()
+            uncombined = self.mf[f"{mf_type}_uncombined"].array()
+            combined[np.isin(uncombined, child_mesh.marker_list)] = child_mesh.primary_marker
 
     @property
     def has_surface(self):
@@ -421,13 +495,9 @@ class ChildMesh(_Mesh):
         self.intersection_map_parent[mesh_id_set] = d.MeshFunction(
             "size_t", self.parent_mesh.dolfin_mesh, self.dimensionality, value=0
         )
-        # map from our cells to parent facets
-        mesh_to_parent = np.array(self.mesh_view[self.parent_mesh.id].cell_map())
-        indices = np.where(self.intersection_map[mesh_id_set].array() == 1)[
-            0
-        ]  # indices of our cells that intersect
-        # indices of parent facets that intersect
-        parent_indices = mesh_to_parent[indices]
+        # indices of parent facets that intersect (the cached map from our cells to
+        # parent facets, masked by the cells that intersect)
+        parent_indices = self.map_cell_to_parent_entity[intersection_map_values]
         self.intersection_map_parent[mesh_id_set].array()[parent_indices] = 1
 
     def get_intersection_submesh(self, mesh_id_set: FrozenSet[int]):
@@ -4,6 +4,7 @@ Functions to create meshes for demos.
 :func:`create_cubes` defines a 'cube-in-a-cube' mesh using the
 built in :class:`dolfin.UnitCubeMesh()`, with subdomains defined and
 marked by :func:`facet_topology` and :func:`cube_condition`
+(or :func:`cube_condition_array` for arrays of cell midpoints)
 :func:`create_spheres`, :func:`create_ellipsoids`,
 :func:`create_cylinders`, and :func:`create_ellipses`
 define meshes using gmsh, which are then converted to
@@ -12,8 +13,15 @@ dolfin meshes using :func:`gmsh_to_dolfin`
 facet markers ``mf2`` to hdf5 and pvd files.
 """
 
-from typing import Tuple
+from typing import Optional, Tuple, Union
+import atexit
+import functools
+import hashlib
+import math
+import os
 import pathlib
+import shutil
+import tempfile
 import numpy as np
 import sympy as sym
 import dolfin as d
@@ -25,6 +33,7 @@ __all__ = [
     "implicit_axisymm",
     "facet_topology",
     "cube_condition",
+    "cube_condition_array",
     "create_cubes",
     "create_spheres",
     "create_ellipsoids",
@@ -37,43 +46,56 @@ __all__ = [
 ]
 
 
-def implicit_axisymm(boundExpr):
-    outerExpr0 = parse_expr(boundExpr)
+@functools.lru_cache(maxsize=64)
+def _compile_bound(boundExpr: str):
+    """
+    Parse an implicit r-z curve `boundExpr` and return the top of the curve
+    on the symmetry axis (r=0) together with numpy callables for the expression
+    and its r and z derivatives. Cached, as the same curves tend to be meshed repeatedly
+    """
     r = sym.Symbol("r", real=True)
     z = sym.Symbol("z", real=True)
-    outerExpr0 = outerExpr0.subs({"r": 0, "z": z})
-    z0 = solveset_real(outerExpr0, z)
+    expr = parse_expr(boundExpr, local_dict={"r": r, "z": z})
+    z0 = solveset_real(expr.subs({r: 0}), z)
+    f = sym.lambdify((r, z), expr, "numpy", cse=True)
+    dfdr = sym.lambdify((r, z), sym.diff(expr, r), "numpy", cse=True)
+    dfdz = sym.lambdify((r, z), sym.diff(expr, z), "numpy", cse=True)
+    return float(max(z0)), f, dfdr, dfdz
+
+
+def implicit_axisymm(boundExpr):
+    # Trace the curve numerically using the expression and its gradient
+    zStart, f, dfdr, dfdz = _compile_bound(boundExpr)
     rVals = [0.0]
-    zVals = [float(max(z0))]
-    sGap = max(z0) / 100
+    zVals = [zStart]
+    sGap = zVals[0] / 100
     curTan = [1, 0]
     while rVals[-1] >= 0 and zVals[-1] >= 0:
         rNext = rVals[-1] + curTan[0] * sGap
         zNext = zVals[-1] + curTan[1] * sGap
-        exprCur = parse_expr(boundExpr)
-        exprCur = exprCur.subs({"r": rNext, "z": z})
-        zNextSol = list(solveset_real(exprCur, z))
-        zNextList = [0] * len(zNextSol)
-        for i in range(len(zNextSol)):
-            zNextList[i] = abs(zNextSol[i] - zNext)
-        if zNextSol == [] or min(zNextList) > sGap:
-            exprCur = parse_expr(boundExpr)
-            exprCur = exprCur.subs({"r": r, "z": zNext})
-            rNextSol = list(solveset_real(exprCur, r))
-            rNextList = [0] * len(rNextSol)
-            for i in range(len(rNextSol)):
-                rNextList[i] = abs(rNextSol[i] - rNext)
-            idx = rNextList.index(min(rNextList))
-            if rNextSol == [] or min(rNextList) > sGap:
-                ValueError("Next point could not be found")
-            rNext = rNextSol[idx]
+        # project the predicted point onto the curve along z, or along r if that fails
+        zNextSol = _find_root(lambda zv: f(rNext, zv), lambda zv: dfdz(rNext, zv), zNext)
+        if zNextSol is None or abs(zNextSol - zNext) > sGap:
+            rNextSol = _find_root(lambda rv: f(rv, zNext), lambda rv: dfdr(rv, zNext), rNext)
+            if rNextSol is None or abs(rNextSol - rNext) > sGap:
+                raise ValueError("Next point could not be found")
+            rNext = rNextSol
         else:
-            idx = zNextList.index(min(zNextList))
-            zNext = zNextSol[idx]
+            zNext = zNextSol
         rVals.append(float(rNext))
         zVals.append(float(zNext))
-        curTan = np.array([rVals[-1] - rVals[-2], zVals[-1] - zVals[-2]])
-        curTan = curTan / np.sqrt(float(curTan[0] ** 2 + curTan[1] ** 2))
+        # exact tangent (perpendicular to the gradient), oriented along the last step
+        dr = rVals[-1] - rVals[-2]
+        dz = zVals[-1] - zVals[-2]
+        tr = -float(dfdz(rVals[-1], zVals[-1]))
+        tz = float(dfdr(rVals[-1], zVals[-1]))
+        if tr * dr + tz * dz < 0:
+            tr, tz = -tr, -tz
+        norm = math.hypot(tr, tz)
+        if norm == 0:
+            # singular point of the curve, fall back to the direction of the last step
+            tr, tz, norm = dr, dz, math.hypot(dr, dz)
+        curTan = (tr / norm, tz / norm)
     if rVals[-1] < 0:
         rVals[-1] = 0
         zVals[-1] = zVals[-2] + (zVals[-1] - zVals[-2]) * (0 - rVals[-2]) / (rVals[-1] - rVals[-2])
@@ -85,6 +107,140 @@ def implicit_axisymm(boundExpr):
     return (rVals, zVals)
 
 
+def _finalize_gmsh():
+    import gmsh
+
+    if gmsh.isInitialized():
+        gmsh.finalize()
+
+
+def _set_gmsh_options(options: dict) -> dict:
+    """
+    Set the numeric gmsh `options` and return their previous values, so that
+    they can be restored afterwards (options are global to the gmsh session)
+    """
+    import gmsh
+
+    previous = {name: gmsh.option.getNumber(name) for name in options}
+    for name, value in options.items():
+        gmsh.option.setNumber(name, value)
+    return previous
+
+
+def _initialize_gmsh(verbose: bool = False) -> dict:
+    """
+    Initialize gmsh if needed. Starting gmsh is slow, so it is kept running between
+    meshes (the mesh builders only remove their model when done) and finalized at exit.
+    If verbose, gmsh output is printed to the terminal.
+    Returns the previous values of the options changed here, which the caller restores
+    with :func:`_set_gmsh_options` once the mesh is built
+    """
+    import gmsh
+
+    if not gmsh.isInitialized():
+        # don't take over SIGINT, as gmsh now stays initialized after meshing
+        # (older gmsh releases have no interruptible argument)
+        try:
+            gmsh.initialize(interruptible=False)
+        except TypeError:
+            gmsh.initialize()
+        atexit.unregister(_finalize_gmsh)
+        atexit.register(_finalize_gmsh)
+    return _set_gmsh_options({"General.Terminal": int(verbose)})
+
+
+def _generate_mesh(meshSizeCallback, dim: int):
+    """
+    Generate a `dim`-dimensional mesh of the current gmsh model,
+    with mesh sizes given by `meshSizeCallback` only.
+    The mesh options and the size callback are reset afterwards
+    """
+    import gmsh
+
+    previous = _set_gmsh_options(
+        {
+            # set off the other options for mesh size determination
+            "Mesh.MeshSizeExtendFromBoundary": 0,
+            "Mesh.MeshSizeFromPoints": 0,
+            "Mesh.MeshSizeFromCurvature": 0,
+            # this changes the algorithm from Frontal-Delaunay to Delaunay,
+            # which may provide better results when there are larger gradients in mesh size
+            "Mesh.Algorithm": 5,
+        }
+    )
+    try:
+        gmsh.model.mesh.setSizeCallback(meshSizeCallback)
+        gmsh.model.mesh.generate(dim)
+    finally:
+        # removeSizeCallback is missing in older gmsh releases
+        if hasattr(gmsh.model.mesh, "removeSizeCallback"):
+            gmsh.model.mesh.removeSizeCallback()
+        _set_gmsh_options(previous)
+
+
+def _write_msh(gmsh_file: pathlib.Path):
+    """
+    Write the current gmsh model to `gmsh_file` in the binary MSH 4.1 format,
+    which meshio reads in bulk rather than parsing text line by line
+    """
+    import gmsh
+
+    # these are global options of the (shared) gmsh session, so restore them afterwards
+    previous = _set_gmsh_options({"Mesh.MshFileVersion": 4.1, "Mesh.Binary": 1})
+    try:
+        gmsh.write(str(gmsh_file))
+    finally:
+        _set_gmsh_options(previous)
+
+
+# Version of the meshes written to the gmsh cache. It is part of the cache key,
+# so bump it whenever a builder that uses the cache (or the meshing options in
+# _generate_mesh) changes the mesh it produces, or stale meshes are reused
+_MSH_CACHE_VERSION = 1
+
+
+def _msh_cache_file(
+    cache_dir: Optional[Union[str, pathlib.Path]], name: str, args: tuple
+) -> Optional[pathlib.Path]:
+    """
+    Path of the cached .msh file for the mesh `name` built from the inputs `args`,
+    or None if no cache directory is given. The key also covers the gmsh version
+    and :data:`_MSH_CACHE_VERSION`, but not the code of the builders, so clear the
+    cache directory after changing a builder locally
+    """
+    import gmsh
+
+    if cache_dir is None:
+        return None
+    key_data = (_MSH_CACHE_VERSION, gmsh.__version__, args)
+    key = hashlib.blake2b(repr(key_data).encode(), digest_size=8).hexdigest()
+    return pathlib.Path(cache_dir) / f"{name}_{key}.msh"
+
+
+def _store_msh(gmsh_file: pathlib.Path, cached_file: pathlib.Path):
+    """
+    Copy a generated .msh file into the cache. The copy is moved into place,
+    so other processes never read a partially written file
+    """
+    cached_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cached_file.with_suffix(f".{os.getpid()}.tmp")
+    shutil.copyfile(gmsh_file, tmp_file)
+    tmp_file.replace(cached_file)
+
+
+def _find_root(func, fprime, x0):
+    """
+    Find a root of `func` close to `x0` with Newton's method.
+    Returns None if the iteration does not converge.
+    """
+    from scipy.optimize import newton
+
+    try:
+        return float(newton(func, x0, fprime=fprime))
+    except (RuntimeError, ZeroDivisionError):
+        return None
+
+
 def facet_topology(f: d.Facet, mf3: d.MeshFunction):
     """
     Given a facet and cell mesh function,
@@ -92,8 +248,10 @@ def facet_topology(f: d.Facet, mf3: d.MeshFunction):
     as either 'boundary' (outer boundary),
     'internal', or 'interface' (boundary of inner cube)
     """
+    # fetch the cell tags once rather than once per adjacent cell
+    tags = mf3.array()
     # cells adjacent face
-    localCells = [mf3.array()[c.index()] for c in d.cells(f)]
+    localCells = [tags[c.index()] for c in d.cells(f)]
     if len(localCells) == 1:
         topology = "boundary"  # boundary facet
     elif len(localCells) == 2 and localCells[0] == localCells[1]:
@@ -110,13 +268,22 @@ def cube_condition(cell, xmin=0.3, xmax=0.7):
     Returns true when inside an inner cube region defined as:
     xmin <= x <= xmax, xmin <= y <= xmax, xmin <= z <= xmax
     """
+    midpoint = cell.midpoint()
     return (
-        (xmin - d.DOLFIN_EPS < cell.midpoint().x() < xmax + d.DOLFIN_EPS)
-        and (xmin - d.DOLFIN_EPS < cell.midpoint().y() < xmax + d.DOLFIN_EPS)
-        and (xmin - d.DOLFIN_EPS < cell.midpoint().z() < xmax + d.DOLFIN_EPS)
+        (xmin - d.DOLFIN_EPS < midpoint.x() < xmax + d.DOLFIN_EPS)
+        and (xmin - d.DOLFIN_EPS < midpoint.y() < xmax + d.DOLFIN_EPS)
+        and (xmin - d.DOLFIN_EPS < midpoint.z() < xmax + d.DOLFIN_EPS)
     )
 
 
+def cube_condition_array(midpoints: np.ndarray, xmin=0.3, xmax=0.7) -> np.ndarray:
+    """
+    Vectorized version of :func:`cube_condition` for an (N, 3) array of cell midpoints.
+    Returns a boolean array that is true for midpoints inside the inner cube
+    """
+    return np.all((midpoints > xmin - d.DOLFIN_EPS) & (midpoints < xmax + d.DOLFIN_EPS), axis=1)
+
+
 def create_cubes(N=16, condition=cube_condition):
     """
     Creates a mesh for use in examples that contains
@@ -136,19 +303,26 @@ def create_cubes(N=16, condition=cube_condition):
     mf3 = d.MeshFunction("size_t", mesh, 3, 0)
     mf2 = d.MeshFunction("size_t", mesh, 2, 0)
 
-    # Mark all cells that satisfy condition as 3, else 1
-    for c in d.cells(mesh):
-        mf3[c] = 2 if condition(c) else 1
-
-    # Mark facets
-    for f in d.faces(mesh):
-        topology, cellIndices = facet_topology(f, mf3)
-        if topology == "interface":
-            mf2[f] = 12
-        elif topology == "boundary":
-            mf2[f] = int(cellIndices[0] * 10)
-        else:
-            mf2[f] = 0
+    # Mark all cells that satisfy condition as 2, else 1
+    if condition is cube_condition:
+        # The default condition only depends on cell midpoints, so check all cells at once
+        midpoints = mesh.coordinates()[mesh.cells()].mean(axis=1)
+        mf3.array()[:] = np.where(cube_condition_array(midpoints), 2, 1)
+    else:
+        mf3.array()[:] = [2 if condition(c) else 1 for c in d.cells(mesh)]
+
+    # Mark facets (see facet_topology) using the cell-to-facet connectivity,
+    # each facet is shared by one (boundary) or two cells
+    mesh.init(3, 2)
+    cell_facets = mesh.topology()(3, 2)().ravel()
+    cell_tags = np.repeat(mf3.array().astype(np.int64), 4)
+    num_facets = mesh.num_entities(2)
+    num_cells = np.bincount(cell_facets, minlength=num_facets)
+    min_tag = np.full(num_facets, np.iinfo(cell_tags.dtype).max, dtype=cell_tags.dtype)
+    max_tag = np.zeros(num_facets, dtype=cell_tags.dtype)
+    np.minimum.at(min_tag, cell_facets, cell_tags)
+    np.maximum.at(max_tag, cell_facets, cell_tags)
+    mf2.array()[:] = np.where(num_cells == 1, min_tag * 10, np.where(min_tag != max_tag, 12, 0))
     return (mesh, mf2, mf3)
 
 
@@ -222,61 +396,65 @@ def create_ellipsoids(
     import gmsh
 
     if np.any(np.isclose(outerRad, 0)):
-        ValueError("One of the outer radii is equal to zero")
+        raise ValueError("One of the outer radii is equal to zero")
     if np.isclose(hEdge, 0):
         hEdge = 0.1 * max(outerRad)
     if np.isclose(hInnerEdge, 0):
         hInnerEdge = 0.2 * max(outerRad) if np.any(np.isclose(innerRad, 0)) else 0.2 * max(innerRad)
     if innerRad[0] > outerRad[0] or innerRad[1] > outerRad[1] or innerRad[2] > outerRad[2]:
-        ValueError("Inner ellipsoid does not fit inside outer ellipsoid")
+        raise ValueError("Inner ellipsoid does not fit inside outer ellipsoid")
     # Create the two ellipsoid mesh using gmsh
-    gmsh.initialize()
-    gmsh.option.setNumber("General.Terminal", int(verbose))
+    gmsh_options = _initialize_gmsh(verbose)
 
     gmsh.model.add("twoellipsoids")
-    # first add ellipsoid 1 of radius outerRad and center (0,0,0)
-    outer_ellipsoid = gmsh.model.occ.addSphere(0, 0, 0, 1.0)
-    gmsh.model.occ.dilate([(3, outer_ellipsoid)], 0, 0, 0, outerRad[0], outerRad[1], outerRad[2])
-    if np.any(np.isclose(innerRad, 0)):
-        # Use outer_ellipsoid only
-        gmsh.model.occ.synchronize()
-        gmsh.model.add_physical_group(3, [outer_ellipsoid], tag=outer_vol_tag)
-        facets = gmsh.model.getBoundary([(3, outer_ellipsoid)])
-        assert len(facets) == 1
-        gmsh.model.add_physical_group(2, [facets[0][1]], tag=outer_marker)
-    else:
-        # Add inner_ellipsoid (radius innerRad, center (0,0,0))
-        inner_ellipsoid = gmsh.model.occ.addSphere(0, 0, 0, 1.0)
+    try:
+        has_inner = not np.any(np.isclose(innerRad, 0))
+        # first add ellipsoid 1 of radius outerRad and center (0,0,0)
+        outer_ellipsoid = gmsh.model.occ.addSphere(0, 0, 0, 1.0)
+        if has_inner:
+            # the inner ellipsoid is scaled from a copy of the same unit sphere
+            inner_ellipsoid = gmsh.model.occ.copy([(3, outer_ellipsoid)])[0][1]
         gmsh.model.occ.dilate(
-            [(3, inner_ellipsoid)], 0, 0, 0, innerRad[0], innerRad[1], innerRad[2]
-        )
-        # Create interface between ellipsoids
-        two_ellipsoids, (outer_ellipsoid_map, inner_ellipsoid_map) = gmsh.model.occ.fragment(
-            [(3, outer_ellipsoid)], [(3, inner_ellipsoid)]
+            [(3, outer_ellipsoid)], 0, 0, 0, outerRad[0], outerRad[1], outerRad[2]
         )
-        gmsh.model.occ.synchronize()
-
-        # Get the outer boundary
-        outer_shell = gmsh.model.getBoundary(two_ellipsoids, oriented=False)
-        assert len(outer_shell) == 1
-        # Get the inner boundary
-        inner_shell = gmsh.model.getBoundary(inner_ellipsoid_map, oriented=False)
-        assert len(inner_shell) == 1
-        # Add physical markers for facets
-        gmsh.model.add_physical_group(outer_shell[0][0], [outer_shell[0][1]], tag=outer_marker)
-        gmsh.model.add_physical_group(inner_shell[0][0], [inner_shell[0][1]], tag=interface_marker)
-
-        # Physical markers for
-        all_volumes = [tag[1] for tag in outer_ellipsoid_map]
-        inner_volume = [tag[1] for tag in inner_ellipsoid_map]
-        outer_volume = []
-        for vol in all_volumes:
-            if vol not in inner_volume:
-                outer_volume.append(vol)
-        gmsh.model.add_physical_group(3, outer_volume, tag=outer_vol_tag)
-        gmsh.model.add_physical_group(3, inner_volume, tag=inner_vol_tag)
-
-    def meshSizeCallback(dim, tag, x, y, z, lc):
+        if not has_inner:
+            # Use outer_ellipsoid only
+            gmsh.model.occ.synchronize()
+            gmsh.model.add_physical_group(3, [outer_ellipsoid], tag=outer_vol_tag)
+            facets = gmsh.model.getBoundary([(3, outer_ellipsoid)])
+            assert len(facets) == 1
+            gmsh.model.add_physical_group(2, [facets[0][1]], tag=outer_marker)
+        else:
+            # Add inner_ellipsoid (radius innerRad, center (0,0,0))
+            gmsh.model.occ.dilate(
+                [(3, inner_ellipsoid)], 0, 0, 0, innerRad[0], innerRad[1], innerRad[2]
+            )
+            # Create interface between ellipsoids
+            two_ellipsoids, (outer_ellipsoid_map, inner_ellipsoid_map) = gmsh.model.occ.fragment(
+                [(3, outer_ellipsoid)], [(3, inner_ellipsoid)]
+            )
+            gmsh.model.occ.synchronize()
+
+            # Get the outer boundary
+            outer_shell = gmsh.model.getBoundary(two_ellipsoids, oriented=False)
+            assert len(outer_shell) == 1
+            # Get the inner boundary
+            inner_shell = gmsh.model.getBoundary(inner_ellipsoid_map, oriented=False)
+            assert len(inner_shell) == 1
+            # Add physical markers for facets
+            gmsh.model.add_physical_group(outer_shell[0][0], [outer_shell[0][1]], tag=outer_marker)
+            gmsh.model.add_physical_group(
+                inner_shell[0][0], [inner_shell[0][1]], tag=interface_marker
+            )
+
+            # Physical markers for
+            all_volumes = [tag[1] for tag in outer_ellipsoid_map]
+            inner_volume = [tag[1] for tag in inner_ellipsoid_map]
+            inner_volume_set = frozenset(inner_volume)
+            outer_volume = [vol for vol in all_volumes if vol not in inner_volume_set]
+            gmsh.model.add_physical_group(3, outer_volume, tag=outer_vol_tag)
+            gmsh.model.add_physical_group(3, inner_volume, tag=inner_vol_tag)
+
         # mesh length is hEdge at the PM (defaults to 0.1*outerRad,
         # or set when calling function) and hInnerEdge at the ERM
         # (defaults to 0.2*innerRad, or set when calling function)
@@ -285,52 +463,43 @@ def create_ellipsoids(
         # If hInnerEdge > 0.2*innerRad, lc = hInnerRad inside the inner ellipsoid
         # if innerRad=0, then the mesh length is interpolated between
         # hEdge at the PM and 0.2*outerRad in the center
-        R_rel_outer = np.sqrt(
-            (x / outerRad[0]) ** 2 + (y / outerRad[1]) ** 2 + (z / outerRad[2]) ** 2
-        )
-        if np.any(np.isclose(innerRad, 0)):
-            lc3 = 0.2 * max(outerRad)
-            innerRad_scale = 0
-            in_outer = True
-        else:
-            R_rel_inner = np.sqrt(
-                (x / innerRad[0]) ** 2 + (y / innerRad[1]) ** 2 + (z / innerRad[2]) ** 2
-            )
-            lc3 = max(hInnerEdge, 0.2 * max(innerRad))
-            innerRad_scale = np.mean(
-                [innerRad[0] / outerRad[0], innerRad[1] / outerRad[1], innerRad[2] / outerRad[2]]
-            )
-            in_outer = R_rel_inner > 1
+        # (everything that does not depend on the point is computed once, not per callback)
         lc1 = hEdge
         lc2 = hInnerEdge
-        if in_outer:
-            lcTest = lc1 + (lc2 - lc1) * (1 - R_rel_outer) / (1 - innerRad_scale)
+        if has_inner:
+            lc3 = max(hInnerEdge, 0.2 * max(innerRad))
+            innerRad_scale = (
+                innerRad[0] / outerRad[0] + innerRad[1] / outerRad[1] + innerRad[2] / outerRad[2]
+            ) / 3
         else:
-            lcTest = lc2 + (lc3 - lc2) * (1 - R_rel_inner)
-        return lcTest
-
-    gmsh.model.mesh.setSizeCallback(meshSizeCallback)
-    # set off the other options for mesh size determination
-    gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
-    # this changes the algorithm from Frontal-Delaunay to Delaunay,
-    # which may provide better results when there are larger gradients in mesh size
-    gmsh.option.setNumber("Mesh.Algorithm", 5)
-
-    gmsh.model.mesh.generate(3)
-    rank = MPI.COMM_WORLD.rank
-    tmp_folder = pathlib.Path(f"tmp_ellipsoid_{outerRad}_{innerRad}_{rank}")
-    tmp_folder.mkdir(exist_ok=True)
-    gmsh_file = tmp_folder / "ellipsoids.msh"
-    gmsh.write(str(gmsh_file))
-    gmsh.finalize()
-
-    # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
-    dmesh, mf2, mf3 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 3, comm)
-    # remove tmp mesh and tmp folder
-    gmsh_file.unlink(missing_ok=False)
-    tmp_folder.rmdir()
+            lc3 = 0.2 * max(outerRad)
+            innerRad_scale = 0
+
+        def meshSizeCallback(dim, tag, x, y, z, lc):
+            R_rel_outer = math.hypot(x / outerRad[0], y / outerRad[1], z / outerRad[2])
+            if has_inner:
+                R_rel_inner = math.hypot(x / innerRad[0], y / innerRad[1], z / innerRad[2])
+                in_outer = R_rel_inner > 1
+            else:
+                in_outer = True
+            if in_outer:
+                lcTest = lc1 + (lc2 - lc1) * (1 - R_rel_outer) / (1 - innerRad_scale)
+            else:
+                lcTest = lc2 + (lc3 - lc2) * (1 - R_rel_inner)
+            return lcTest
+
+        _generate_mesh(meshSizeCallback, 3)
+        # the temporary folder is unique per call (and process) and removed afterwards
+        with tempfile.TemporaryDirectory(prefix="tmp_ellipsoid_") as tmp_dir:
+            tmp_folder = pathlib.Path(tmp_dir)
+            gmsh_file = tmp_folder / "ellipsoids.msh"
+            _write_msh(gmsh_file)
+
+            # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
+            dmesh, mf2, mf3 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 3, comm)
+    finally:
+        gmsh.model.remove()
+        _set_gmsh_options(gmsh_options)
     # return dolfin mesh, mf2 (2d tags) and mf3 (3d tags)
     return (dmesh, mf2, mf3)
 
@@ -370,13 +539,15 @@ def create_axisymm(
         Tuple (mesh, facet_marker, cell_marker)
     """
     import gmsh
+    from scipy.spatial import cKDTree
 
     if outerExpr == "":
-        ValueError("Outer surface is not defined")
+        raise ValueError("Outer surface is not defined")
 
     rValsOuter, zValsOuter = implicit_axisymm(outerExpr)
 
-    if not innerExpr == "":
+    has_inner = innerExpr != ""
+    if has_inner:
         rValsInner, zValsInner = implicit_axisymm(innerExpr)
         zMid = np.mean(zValsInner)
         ROuterVec = np.sqrt(rValsOuter**2 + (zValsOuter - zMid) ** 2)
@@ -390,146 +561,135 @@ def create_axisymm(
     if np.isclose(hEdge, 0):
         hEdge = 0.1 * maxOuterDim
     if np.isclose(hInnerEdge, 0):
-        hInnerEdge = 0.2 * maxOuterDim if innerExpr == "" else 0.2 * maxInnerDim
+        hInnerEdge = 0.2 * maxInnerDim if has_inner else 0.2 * maxOuterDim
     # Create the two axisymmetric body mesh using gmsh
-    gmsh.initialize()
-    gmsh.option.setNumber("General.Terminal", int(verbose))
+    gmsh_options = _initialize_gmsh(verbose)
     gmsh.model.add("axisymm")
-    # first add outer body and revolve
-    outer_tag_list = []
-    for i in range(len(rValsOuter)):
-        cur_tag = gmsh.model.occ.add_point(rValsOuter[i], 0, zValsOuter[i])
-        outer_tag_list.append(cur_tag)
-    outer_spline_tag = gmsh.model.occ.add_spline(outer_tag_list)
-    if np.isclose(zValsOuter[-1], 0):  # then include substrate at z=0
-        origin_tag = gmsh.model.occ.add_point(0, 0, 0)
-        symm_axis_tag = gmsh.model.occ.add_line(origin_tag, outer_tag_list[0])
-        bottom_tag = gmsh.model.occ.add_line(origin_tag, outer_tag_list[-1])
-        outer_loop_tag = gmsh.model.occ.add_curve_loop(
-            [outer_spline_tag, symm_axis_tag, bottom_tag]
-        )
-    else:
-        symm_axis_tag = gmsh.model.occ.add_line(outer_tag_list[0], outer_tag_list[-1])
-        outer_loop_tag = gmsh.model.occ.add_curve_loop([outer_spline_tag, symm_axis_tag])
-    cell_plane_tag = gmsh.model.occ.add_plane_surface([outer_loop_tag])
-    outer_shape = gmsh.model.occ.revolve([(2, cell_plane_tag)], 0, 0, 0, 0, 0, 1, 2 * np.pi)
-    outer_shape_tags = []
-    for i in range(len(outer_shape)):
-        if outer_shape[i][0] == 3:  # pull out tags associated with 3d objects
-            outer_shape_tags.append(outer_shape[i][1])
-    assert len(outer_shape_tags) == 1  # should be just one 3D body from the full revolution
-
-    if innerExpr == "":
-        # No inner shape in this case
-        gmsh.model.occ.synchronize()
-        gmsh.model.add_physical_group(3, outer_shape_tags, tag=outer_vol_tag)
-        facets = gmsh.model.getBoundary([(3, outer_shape_tags[0])])
-        assert (
-            len(facets) == 2
-        )  # 2 boundaries because of bottom surface at z = 0, both belong to PM
-        gmsh.model.add_physical_group(2, [facets[0][1], facets[1][1]], tag=outer_marker)
-    else:
-        # Add inner shape
-        inner_tag_list = []
-        for i in range(len(rValsInner)):
-            cur_tag = gmsh.model.occ.add_point(rValsInner[i], 0, zValsInner[i])
-            inner_tag_list.append(cur_tag)
-        inner_spline_tag = gmsh.model.occ.add_spline(inner_tag_list)
-        symm_inner_tag = gmsh.model.occ.add_line(inner_tag_list[0], inner_tag_list[-1])
-        inner_loop_tag = gmsh.model.occ.add_curve_loop([inner_spline_tag, symm_inner_tag])
-        inner_plane_tag = gmsh.model.occ.add_plane_surface([inner_loop_tag])
-        inner_shape = gmsh.model.occ.revolve([(2, inner_plane_tag)], 0, 0, 0, 0, 0, 1, 2 * np.pi)
-        inner_shape_tags = []
-        for i in range(len(inner_shape)):
-            if inner_shape[i][0] == 3:  # pull out tags associated with 3d objects
-                inner_shape_tags.append(inner_shape[i][1])
-        assert len(inner_shape_tags) == 1  # should be just one 3D body from the full revolution
-
-        # Create interface between 2 objects
-        two_shapes, (outer_shape_map, inner_shape_map) = gmsh.model.occ.fragment(
-            [(3, outer_shape_tags[0])], [(3, inner_shape_tags[0])]
-        )
-        gmsh.model.occ.synchronize()
-
-        # Get the outer boundary
-        outer_shell = gmsh.model.getBoundary(two_shapes, oriented=False)
-        assert (
-            len(outer_shell) == 2
-        )  # 2 boundaries because of bottom surface at z = 0, both belong to PM
-        # Get the inner boundary
-        inner_shell = gmsh.model.getBoundary(inner_shape_map, oriented=False)
-        assert len(inner_shell) == 1
-        # Add physical markers for facets
-        gmsh.model.add_physical_group(
-            outer_shell[0][0], [outer_shell[0][1], outer_shell[1][1]], tag=outer_marker
-        )
-        gmsh.model.add_physical_group(inner_shell[0][0], [inner_shell[0][1]], tag=interface_marker)
-
-        # Physical markers for
-        all_volumes = [tag[1] for tag in outer_shape_map]
-        inner_volume = [tag[1] for tag in inner_shape_map]
-        outer_volume = []
-        for vol in all_volumes:
-            if vol not in inner_volume:
-                outer_volume.append(vol)
-        gmsh.model.add_physical_group(3, outer_volume, tag=outer_vol_tag)
-        gmsh.model.add_physical_group(3, inner_volume, tag=inner_vol_tag)
-
-    def meshSizeCallback(dim, tag, x, y, z, lc):
-        # mesh length is hEdge at the PM and hInnerEdge at the inner membrane
-        # between these, the value is interpolated based on the relative distance
-        # between the two membranes.
-        # Inside the inner shape, the value is interpolated between hInnerEdge
-        # and lc3, where lc3 = max(hInnerEdge, 0.2*maxInnerDim)
-        # if innerRad=0, then the mesh length is interpolated between
-        # hEdge at the PM and 0.2*maxOuterDim in the center
-        rCur = np.sqrt(x**2 + y**2)
-        RCur = np.sqrt(rCur**2 + (z - zMid) ** 2)
-        outer_dist = np.sqrt((rCur - rValsOuter) ** 2 + (z - zValsOuter) ** 2)
-        np.append(outer_dist, z)  # include the distance from the substrate
-        dist_to_outer = min(outer_dist)
-        if innerExpr == "":
-            lc3 = 0.2 * maxOuterDim
-            dist_to_inner = RCur
-            in_outer = True
+    try:
+        # first add outer body and revolve
+        add_point = gmsh.model.occ.add_point
+        outer_tag_list = [
+            add_point(r, 0, z) for r, z in zip(rValsOuter.tolist(), zValsOuter.tolist())
+        ]
+        outer_spline_tag = gmsh.model.occ.add_spline(outer_tag_list)
+        if np.isclose(zValsOuter[-1], 0):  # then include substrate at z=0
+            origin_tag = gmsh.model.occ.add_point(0, 0, 0)
+            symm_axis_tag = gmsh.model.occ.add_line(origin_tag, outer_tag_list[0])
+            bottom_tag = gmsh.model.occ.add_line(origin_tag, outer_tag_list[-1])
+            outer_loop_tag = gmsh.model.occ.add_curve_loop(
+                [outer_spline_tag, symm_axis_tag, bottom_tag]
+            )
         else:
-            inner_dist = np.sqrt((rCur - rValsInner) ** 2 + (z - zValsInner) ** 2)
-            dist_to_inner = min(inner_dist)
-            inner_idx = np.argmin(inner_dist)
-            inner_rad = RInnerVec[inner_idx]
-            R_rel_inner = RCur / inner_rad
-            lc3 = max(hInnerEdge, 0.2 * maxInnerDim)
-            in_outer = R_rel_inner > 1
+            symm_axis_tag = gmsh.model.occ.add_line(outer_tag_list[0], outer_tag_list[-1])
+            outer_loop_tag = gmsh.model.occ.add_curve_loop([outer_spline_tag, symm_axis_tag])
+        cell_plane_tag = gmsh.model.occ.add_plane_surface([outer_loop_tag])
+        outer_shape = gmsh.model.occ.revolve([(2, cell_plane_tag)], 0, 0, 0, 0, 0, 1, 2 * np.pi)
+        # pull out tags associated with 3d objects
+        outer_shape_tags = [tag for dim, tag in outer_shape if dim == 3]
+        assert len(outer_shape_tags) == 1  # should be just one 3D body from the full revolution
+
+        if not has_inner:
+            # No inner shape in this case
+            gmsh.model.occ.synchronize()
+            gmsh.model.add_physical_group(3, outer_shape_tags, tag=outer_vol_tag)
+            facets = gmsh.model.getBoundary([(3, outer_shape_tags[0])])
+            assert (
+                len(facets) == 2
+            )  # 2 boundaries because of bottom surface at z = 0, both belong to PM
+            gmsh.model.add_physical_group(2, [facets[0][1], facets[1][1]], tag=outer_marker)
+        else:
+            # Add inner shape
+            inner_tag_list = [
+                add_point(r, 0, z) for r, z in zip(rValsInner.tolist(), zValsInner.tolist())
+            ]
+            inner_spline_tag = gmsh.model.occ.add_spline(inner_tag_list)
+            symm_inner_tag = gmsh.model.occ.add_line(inner_tag_list[0], inner_tag_list[-1])
+            inner_loop_tag = gmsh.model.occ.add_curve_loop([inner_spline_tag, symm_inner_tag])
+            inner_plane_tag = gmsh.model.occ.add_plane_surface([inner_loop_tag])
+            inner_shape = gmsh.model.occ.revolve(
+                [(2, inner_plane_tag)], 0, 0, 0, 0, 0, 1, 2 * np.pi
+            )
+            # pull out tags associated with 3d objects
+            inner_shape_tags = [tag for dim, tag in inner_shape if dim == 3]
+            assert len(inner_shape_tags) == 1  # should be just one 3D body from the full revolution
+
+            # Create interface between 2 objects
+            two_shapes, (outer_shape_map, inner_shape_map) = gmsh.model.occ.fragment(
+                [(3, outer_shape_tags[0])], [(3, inner_shape_tags[0])]
+            )
+            gmsh.model.occ.synchronize()
+
+            # Get the outer boundary
+            outer_shell = gmsh.model.getBoundary(two_shapes, oriented=False)
+            assert (
+                len(outer_shell) == 2
+            )  # 2 boundaries because of bottom surface at z = 0, both belong to PM
+            # Get the inner boundary
+            inner_shell = gmsh.model.getBoundary(inner_shape_map, oriented=False)
+            assert len(inner_shell) == 1
+            # Add physical markers for facets
+            gmsh.model.add_physical_group(
+                outer_shell[0][0], [outer_shell[0][1], outer_shell[1][1]], tag=outer_marker
+            )
+            gmsh.model.add_physical_group(
+                inner_shell[0][0], [inner_shell[0][1]], tag=interface_marker
+            )
+
+            # Physical markers for
+            all_volumes = [tag[1] for tag in outer_shape_map]
+            inner_volume = [tag[1] for tag in inner_shape_map]
+            inner_volume_set = frozenset(inner_volume)
+            outer_volume = [vol for vol in all_volumes if vol not in inner_volume_set]
+            gmsh.model.add_physical_group(3, outer_volume, tag=outer_vol_tag)
+            gmsh.model.add_physical_group(3, inner_volume, tag=inner_vol_tag)
+
+        # Closest points on the bounding curves are looked up in k-d trees
+        outer_tree = cKDTree(np.column_stack([rValsOuter, zValsOuter]))
+        if has_inner:
+            inner_tree = cKDTree(np.column_stack([rValsInner, zValsInner]))
+
+        # mesh sizes used by the callback do not depend on the point, so compute them once
         lc1 = hEdge
         lc2 = hInnerEdge
-        if in_outer:
-            lcTest = lc1 + (lc2 - lc1) * (dist_to_outer) / (dist_to_inner + dist_to_outer)
-        else:
-            lcTest = lc2 + (lc3 - lc2) * (1 - R_rel_inner)
-        return lcTest
-
-    gmsh.model.mesh.setSizeCallback(meshSizeCallback)
-    # set off the other options for mesh size determination
-    gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
-    # this changes the algorithm from Frontal-Delaunay to Delaunay,
-    # which may provide better results when there are larger gradients in mesh size
-    gmsh.option.setNumber("Mesh.Algorithm", 5)
-
-    gmsh.model.mesh.generate(3)
-    rank = MPI.COMM_WORLD.rank
-    tmp_folder = pathlib.Path(f"tmp_axisymm_{rank}")
-    tmp_folder.mkdir(exist_ok=True)
-    gmsh_file = tmp_folder / "axisymm.msh"
-    gmsh.write(str(gmsh_file))
-    gmsh.finalize()
-
-    # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
-    dmesh, mf2, mf3 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 3, comm)
-    # remove tmp mesh and tmp folder
-    gmsh_file.unlink(missing_ok=False)
-    tmp_folder.rmdir()
+        lc3 = max(hInnerEdge, 0.2 * maxInnerDim) if has_inner else 0.2 * maxOuterDim
+
+        def meshSizeCallback(dim, tag, x, y, z, lc):
+            # mesh length is hEdge at the PM and hInnerEdge at the inner membrane
+            # between these, the value is interpolated based on the relative distance
+            # between the two membranes.
+            # Inside the inner shape, the value is interpolated between hInnerEdge
+            # and lc3, where lc3 = max(hInnerEdge, 0.2*maxInnerDim)
+            # if innerRad=0, then the mesh length is interpolated between
+            # hEdge at the PM and 0.2*maxOuterDim in the center
+            rCur = math.hypot(x, y)
+            RCur = math.hypot(rCur, z - zMid)
+            dist_to_outer, _ = outer_tree.query((rCur, z))
+            if has_inner:
+                dist_to_inner, inner_idx = inner_tree.query((rCur, z))
+                inner_rad = RInnerVec[inner_idx]
+                R_rel_inner = RCur / inner_rad
+                in_outer = R_rel_inner > 1
+            else:
+                dist_to_inner = RCur
+                in_outer = True
+            if in_outer:
+                lcTest = lc1 + (lc2 - lc1) * (dist_to_outer) / (dist_to_inner + dist_to_outer)
+            else:
+                lcTest = lc2 + (lc3 - lc2) * (1 - R_rel_inner)
+            return lcTest
+
+        _generate_mesh(meshSizeCallback, 3)
+        # the temporary folder is unique per call (and process) and removed afterwards
+        with tempfile.TemporaryDirectory(prefix="tmp_axisymm_") as tmp_dir:
+            tmp_folder = pathlib.Path(tmp_dir)
+            gmsh_file = tmp_folder / "axisymm.msh"
+            _write_msh(gmsh_file)
+
+            # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
+            dmesh, mf2, mf3 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 3, comm)
+    finally:
+        gmsh.model.remove()
+        _set_gmsh_options(gmsh_options)
     # return dolfin mesh, mf2 (2d tags) and mf3 (3d tags)
     return (dmesh, mf2, mf3)
 
@@ -574,57 +734,56 @@ def create_cylinders(
     import gmsh
 
     if np.isclose(outerRad, 0):
-        ValueError("Outer radius is equal to zero")
+        raise ValueError("Outer radius is equal to zero")
     if np.isclose(hEdge, 0):
-        hEdge = 0.1 * max(outerRad)
+        hEdge = 0.1 * outerRad
     if np.isclose(hInnerEdge, 0):
         hInnerEdge = 0.2 * outerRad if np.isclose(innerRad, 0) else 0.2 * innerRad
-    if innerRad > outerRad or innerLength >= outerLength:
-        ValueError("Inner cylinder does not fit inside outer cylinder")
+    if not np.isclose(innerRad, 0) and (innerRad > outerRad or innerLength >= outerLength):
+        raise ValueError("Inner cylinder does not fit inside outer cylinder")
     # Create the two cylinder mesh using gmsh
-    gmsh.initialize()
-    gmsh.option.setNumber("General.Terminal", int(verbose))
+    gmsh_options = _initialize_gmsh(verbose)
 
     gmsh.model.add("twocylinders")
-    # first add cylinder 1 of radius outerRad and center (0,0,0)
-    outer_cylinder = gmsh.model.occ.addCylinder(0, 0, 0, 0, 0, outerLength, outerRad)
-    if np.isclose(innerRad, 0):
-        # Use outer_cylinder only
-        gmsh.model.occ.synchronize()
-        gmsh.model.add_physical_group(3, [outer_cylinder], tag=outer_vol_tag)
-        facets = gmsh.model.getBoundary([(3, outer_cylinder)])
-        gmsh.model.add_physical_group(2, [facets[0][1]], tag=outer_marker)
-    else:
-        # Add inner_cylinder (radius innerRad,
-        # center (0,0,(outerLength-innerLength)/2))
-        inner_cylinder = gmsh.model.occ.addCylinder(
-            0, 0, (outerLength - innerLength) / 2, 0, 0, innerLength, innerRad
-        )
-        # Create interface between cylinders
-        two_cylinders, (outer_cylinder_map, inner_cylinder_map) = gmsh.model.occ.fragment(
-            [(3, outer_cylinder)], [(3, inner_cylinder)]
-        )
-        gmsh.model.occ.synchronize()
-
-        # Get the outer boundary
-        outer_shell = gmsh.model.getBoundary(two_cylinders, oriented=False)
-        # Get the inner boundary
-        inner_shell = gmsh.model.getBoundary(inner_cylinder_map, oriented=False)
-        # Add physical markers for facets
-        gmsh.model.add_physical_group(outer_shell[0][0], [outer_shell[0][1]], tag=outer_marker)
-        gmsh.model.add_physical_group(inner_shell[0][0], [inner_shell[0][1]], tag=interface_marker)
-
-        # Physical markers for
-        all_volumes = [tag[1] for tag in outer_cylinder_map]
-        inner_volume = [tag[1] for tag in inner_cylinder_map]
-        outer_volume = []
-        for vol in all_volumes:
-            if vol not in inner_volume:
-                outer_volume.append(vol)
-        gmsh.model.add_physical_group(3, outer_volume, tag=outer_vol_tag)
-        gmsh.model.add_physical_group(3, inner_volume, tag=inner_vol_tag)
-
-    def meshSizeCallback(dim, tag, x, y, z, lc):
+    try:
+        # first add cylinder 1 of radius outerRad and center (0,0,0)
+        outer_cylinder = gmsh.model.occ.addCylinder(0, 0, 0, 0, 0, outerLength, outerRad)
+        if np.isclose(innerRad, 0):
+            # Use outer_cylinder only
+            gmsh.model.occ.synchronize()
+            gmsh.model.add_physical_group(3, [outer_cylinder], tag=outer_vol_tag)
+            facets = gmsh.model.getBoundary([(3, outer_cylinder)])
+            gmsh.model.add_physical_group(2, [facets[0][1]], tag=outer_marker)
+        else:
+            # Add inner_cylinder (radius innerRad,
+            # center (0,0,(outerLength-innerLength)/2))
+            inner_cylinder = gmsh.model.occ.addCylinder(
+                0, 0, (outerLength - innerLength) / 2, 0, 0, innerLength, innerRad
+            )
+            # Create interface between cylinders
+            two_cylinders, (outer_cylinder_map, inner_cylinder_map) = gmsh.model.occ.fragment(
+                [(3, outer_cylinder)], [(3, inner_cylinder)]
+            )
+            gmsh.model.occ.synchronize()
+
+            # Get the outer boundary
+            outer_shell = gmsh.model.getBoundary(two_cylinders, oriented=False)
+            # Get the inner boundary
+            inner_shell = gmsh.model.getBoundary(inner_cylinder_map, oriented=False)
+            # Add physical markers for facets
+            gmsh.model.add_physical_group(outer_shell[0][0], [outer_shell[0][1]], tag=outer_marker)
+            gmsh.model.add_physical_group(
+                inner_shell[0][0], [inner_shell[0][1]], tag=interface_marker
+            )
+
+            # Physical markers for
+            all_volumes = [tag[1] for tag in outer_cylinder_map]
+            inner_volume = [tag[1] for tag in inner_cylinder_map]
+            inner_volume_set = frozenset(inner_volume)
+            outer_volume = [vol for vol in all_volumes if vol not in inner_volume_set]
+            gmsh.model.add_physical_group(3, outer_volume, tag=outer_vol_tag)
+            gmsh.model.add_physical_group(3, inner_volume, tag=inner_vol_tag)
+
         # mesh length is hEdge at the PM (defaults to 0.1*outerRad,
         # or set when calling function) and hInnerEdge at the ERM
         # (defaults to 0.2*innerRad, or set when calling function)
@@ -632,41 +791,31 @@ def create_cylinders(
         # and inside the value is interpolated between hInnerEdge and 0.2*innerRad
         # if innerRad=0, then the mesh length is interpolated between
         # hEdge at the PM and 0.2*outerRad in the center
-        r_cur = np.sqrt(x**2 + y**2)
-        if np.isclose(innerRad, 0):
-            lc3 = 0.2 * outerRad
-        else:
-            lc3 = max(hInnerEdge, 0.2 * innerRad)
+        # (the sizes are fixed, so compute them once and not in every callback)
         lc1 = hEdge
         lc2 = hInnerEdge
-        if r_cur > innerRad:
-            lcTest = lc1 + (lc2 - lc1) * (outerRad - r_cur) / (outerRad - innerRad)
-        else:
-            lcTest = lc2 + (lc3 - lc2) * (innerRad - r_cur) / innerRad
-        return lcTest
-
-    gmsh.model.mesh.setSizeCallback(meshSizeCallback)
-    # set off the other options for mesh size determination
-    gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
-    # this changes the algorithm from Frontal-Delaunay to Delaunay,
-    # which may provide better results when there are larger gradients in mesh size
-    gmsh.option.setNumber("Mesh.Algorithm", 5)
-
-    gmsh.model.mesh.generate(3)
-    rank = MPI.COMM_WORLD.rank
-    tmp_folder = pathlib.Path(f"tmp_cylinder_{outerRad}_{innerRad}_{rank}")
-    tmp_folder.mkdir(exist_ok=True)
-    gmsh_file = tmp_folder / "cylinders.msh"
-    gmsh.write(str(gmsh_file))
-    gmsh.finalize()
-
-    # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
-    dmesh, mf2, mf3 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 3, comm)
-    # remove tmp mesh and tmp folder
-    gmsh_file.unlink(missing_ok=False)
-    tmp_folder.rmdir()
+        lc3 = 0.2 * outerRad if np.isclose(innerRad, 0) else max(hInnerEdge, 0.2 * innerRad)
+
+        def meshSizeCallback(dim, tag, x, y, z, lc):
+            r_cur = math.hypot(x, y)
+            if r_cur > innerRad:
+                lcTest = lc1 + (lc2 - lc1) * (outerRad - r_cur) / (outerRad - innerRad)
+            else:
+                lcTest = lc2 + (lc3 - lc2) * (innerRad - r_cur) / innerRad
+            return lcTest
+
+        _generate_mesh(meshSizeCallback, 3)
+        # the temporary folder is unique per call (and process) and removed afterwards
+        with tempfile.TemporaryDirectory(prefix="tmp_cylinder_") as tmp_dir:
+            tmp_folder = pathlib.Path(tmp_dir)
+            gmsh_file = tmp_folder / "cylinders.msh"
+            _write_msh(gmsh_file)
+
+            # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
+            dmesh, mf2, mf3 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 3, comm)
+    finally:
+        gmsh.model.remove()
+        _set_gmsh_options(gmsh_options)
     # return dolfin mesh, mf2 (2d tags) and mf3 (3d tags)
     return (dmesh, mf2, mf3)
 
@@ -684,6 +833,7 @@ def create_ellipses(
     outer_tag: int = 1,
     comm: MPI.Comm = d.MPI.comm_world,
     verbose: bool = True,
+    cache_dir: Optional[Union[str, pathlib.Path]] = None,
 ) -> Tuple[d.Mesh, d.MeshFunction, d.MeshFunction]:
     """
     Creates a mesh for an ellipse surface,
@@ -701,65 +851,88 @@ def create_ellipses(
         outer_tag: The value to mark the outer ellipse surface with
         comm: MPI communicator to create the mesh with
         verbose: If true print gmsh output, else skip
+        cache_dir: If given, the gmsh mesh is stored in this folder and reused
+            by later calls with the same inputs (and gmsh version) instead of meshing
+            again. Clear the folder if the meshing code is changed
     Returns:
         Tuple (mesh, facet_marker (mf1), cell_marker(mf2))
     """
     import gmsh
 
+    cached_msh = _msh_cache_file(
+        cache_dir,
+        "ellipses",
+        (
+            xrad_outer,
+            yrad_outer,
+            xrad_inner,
+            yrad_inner,
+            hEdge,
+            hInnerEdge,
+            interface_marker,
+            outer_marker,
+            inner_tag,
+            outer_tag,
+        ),
+    )
+    if cached_msh is not None and cached_msh.is_file():
+        with tempfile.TemporaryDirectory(prefix="tmp_ellipse_") as tmp_dir:
+            return gmsh_to_dolfin(str(cached_msh), pathlib.Path(tmp_dir), 2, comm)
+
     outerRad = [xrad_outer, yrad_outer]
     innerRad = [xrad_inner, yrad_inner]
     if np.any(np.isclose(outerRad, 0)):
-        ValueError("One of the outer radii is equal to zero")
+        raise ValueError("One of the outer radii is equal to zero")
     if np.isclose(hEdge, 0):
         hEdge = 0.1 * max(outerRad)
     if np.isclose(hInnerEdge, 0):
         hInnerEdge = 0.2 * max(outerRad) if np.any(np.isclose(innerRad, 0)) else 0.2 * max(innerRad)
     if innerRad[0] > outerRad[0] or innerRad[1] > outerRad[1]:
-        ValueError("Inner ellipse does not fit inside outer ellipse")
+        raise ValueError("Inner ellipse does not fit inside outer ellipse")
     # Create the two ellipse mesh using gmsh
-    gmsh.initialize()
-    gmsh.option.setNumber("General.Terminal", int(verbose))
+    gmsh_options = _initialize_gmsh(verbose)
 
     gmsh.model.add("ellipses")
-    # first add ellipse 1 of radius outerRad and center (0,0,0)
-    outer_ellipse = gmsh.model.occ.addDisk(0, 0, 0, xrad_outer, yrad_outer)
-    if np.any(np.isclose(innerRad, 0)):
-        # Use outer_ellipse only
-        gmsh.model.occ.synchronize()
-        gmsh.model.add_physical_group(2, [outer_ellipse], tag=outer_tag)
-        facets = gmsh.model.getBoundary([(2, outer_ellipse)])
-        assert len(facets) == 1
-        gmsh.model.add_physical_group(1, [facets[0][1]], tag=outer_marker)
-    else:
-        # Add inner_ellipse (radius innerRad, center (0,0,0))
-        inner_ellipse = gmsh.model.occ.addDisk(0, 0, 0, xrad_inner, yrad_inner)
-        # Create interface between ellipses
-        two_ellipses, (outer_ellipse_map, inner_ellipse_map) = gmsh.model.occ.fragment(
-            [(2, outer_ellipse)], [(2, inner_ellipse)]
-        )
-        gmsh.model.occ.synchronize()
-
-        # Get the outer boundary
-        outer_shell = gmsh.model.getBoundary(two_ellipses, oriented=False)
-        assert len(outer_shell) == 1
-        # Get the inner boundary
-        inner_shell = gmsh.model.getBoundary(inner_ellipse_map, oriented=False)
-        assert len(inner_shell) == 1
-        # Add physical markers for facets
-        gmsh.model.add_physical_group(outer_shell[0][0], [outer_shell[0][1]], tag=outer_marker)
-        gmsh.model.add_physical_group(inner_shell[0][0], [inner_shell[0][1]], tag=interface_marker)
-
-        # Physical markers for
-        all_surfs = [tag[1] for tag in outer_ellipse_map]
-        inner_surf = [tag[1] for tag in inner_ellipse_map]
-        outer_surf = []
-        for surf in all_surfs:
-            if surf not in inner_surf:
-                outer_surf.append(surf)
-        gmsh.model.add_physical_group(2, outer_surf, tag=outer_tag)
-        gmsh.model.add_physical_group(2, inner_surf, tag=inner_tag)
-
-    def meshSizeCallback(dim, tag, x, y, z, lc):
+    try:
+        has_inner = not np.any(np.isclose(innerRad, 0))
+        # first add ellipse 1 of radius outerRad and center (0,0,0)
+        outer_ellipse = gmsh.model.occ.addDisk(0, 0, 0, xrad_outer, yrad_outer)
+        if not has_inner:
+            # Use outer_ellipse only
+            gmsh.model.occ.synchronize()
+            gmsh.model.add_physical_group(2, [outer_ellipse], tag=outer_tag)
+            facets = gmsh.model.getBoundary([(2, outer_ellipse)])
+            assert len(facets) == 1
+            gmsh.model.add_physical_group(1, [facets[0][1]], tag=outer_marker)
+        else:
+            # Add inner_ellipse (radius innerRad, center (0,0,0))
+            inner_ellipse = gmsh.model.occ.addDisk(0, 0, 0, xrad_inner, yrad_inner)
+            # Create interface between ellipses
+            two_ellipses, (outer_ellipse_map, inner_ellipse_map) = gmsh.model.occ.fragment(
+                [(2, outer_ellipse)], [(2, inner_ellipse)]
+            )
+            gmsh.model.occ.synchronize()
+
+            # Get the outer boundary
+            outer_shell = gmsh.model.getBoundary(two_ellipses, oriented=False)
+            assert len(outer_shell) == 1
+            # Get the inner boundary
+            inner_shell = gmsh.model.getBoundary(inner_ellipse_map, oriented=False)
+            assert len(inner_shell) == 1
+            # Add physical markers for facets
+            gmsh.model.add_physical_group(outer_shell[0][0], [outer_shell[0][1]], tag=outer_marker)
+            gmsh.model.add_physical_group(
+                inner_shell[0][0], [inner_shell[0][1]], tag=interface_marker
+            )
+
+            # Physical markers for
+            all_surfs = [tag[1] for tag in outer_ellipse_map]
+            inner_surf = [tag[1] for tag in inner_ellipse_map]
+            inner_surf_set = frozenset(inner_surf)
+            outer_surf = [surf for surf in all_surfs if surf not in inner_surf_set]
+            gmsh.model.add_physical_group(2, outer_surf, tag=outer_tag)
+            gmsh.model.add_physical_group(2, inner_surf, tag=inner_tag)
+
         # mesh length is hEdge at the PM (defaults to 0.1*outerRad,
         # or set when calling function) and hInnerEdge at the ERM
         # (defaults to 0.2*innerRad, or set when calling function)
@@ -768,46 +941,46 @@ def create_ellipses(
         # If hInnerEdge > 0.2*innerRad, lc = hInnerEdge inside the inner ellipse
         # if innerRad=0, then the mesh length is interpolated between
         # hEdge at the PM and 0.2*outerRad in the center
-        R_rel_outer = np.sqrt((x / outerRad[0]) ** 2 + (y / outerRad[1]) ** 2)
-        if np.any(np.isclose(innerRad, 0)):
-            lc3 = 0.2 * max(outerRad)
-            innerRad_scale = 0
-            in_outer = True
-        else:
-            R_rel_inner = np.sqrt((x / innerRad[0]) ** 2 + (y / innerRad[1]) ** 2)
-            lc3 = max(hInnerEdge, 0.2 * max(innerRad))
-            innerRad_scale = np.mean([innerRad[0] / outerRad[0], innerRad[1] / outerRad[1]])
-            in_outer = R_rel_inner > 1
+        # (everything that does not depend on the point is computed once, not per callback)
         lc1 = hEdge
         lc2 = hInnerEdge
-        if in_outer:
-            lcTest = lc1 + (lc2 - lc1) * (1 - R_rel_outer) / (1 - innerRad_scale)
+        if has_inner:
+            lc3 = max(hInnerEdge, 0.2 * max(innerRad))
+            innerRad_scale = (innerRad[0] / outerRad[0] + innerRad[1] / outerRad[1]) / 2
         else:
-            lcTest = lc2 + (lc3 - lc2) * (1 - R_rel_inner)
-        return lcTest
-
-    gmsh.model.mesh.setSizeCallback(meshSizeCallback)
-    # set off the other options for mesh size determination
-    gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
-    # this changes the algorithm from Frontal-Delaunay to Delaunay,
-    # which may provide better results when there are larger gradients in mesh size
-    gmsh.option.setNumber("Mesh.Algorithm", 5)
-
-    gmsh.model.mesh.generate(2)
-    rank = MPI.COMM_WORLD.rank
-    tmp_folder = pathlib.Path(f"tmp_ellipse_{outerRad}_{innerRad}_{rank}")
-    tmp_folder.mkdir(exist_ok=True)
-    gmsh_file = tmp_folder / "ellipses.msh"
-    gmsh.write(str(gmsh_file))
-    gmsh.finalize()
-
-    # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
-    dmesh, mf1, mf2 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 2, comm)
-    # remove tmp mesh and tmp folder
-    gmsh_file.unlink(missing_ok=False)
-    tmp_folder.rmdir()
+            lc3 = 0.2 * max(outerRad)
+            innerRad_scale = 0
+        outer_slope = (lc2 - lc1) / (1 - innerRad_scale)
+        inv_xo, inv_yo = 1.0 / outerRad[0], 1.0 / outerRad[1]
+        inv_xi, inv_yi = (1.0 / innerRad[0], 1.0 / innerRad[1]) if has_inner else (0.0, 0.0)
+
+        def meshSizeCallback(dim, tag, x, y, z, lc):
+            R_rel_outer = math.hypot(x * inv_xo, y * inv_yo)
+            if has_inner:
+                R_rel_inner = math.hypot(x * inv_xi, y * inv_yi)
+                in_outer = R_rel_inner > 1
+            else:
+                in_outer = True
+            if in_outer:
+                lcTest = lc1 + outer_slope * (1 - R_rel_outer)
+            else:
+                lcTest = lc2 + (lc3 - lc2) * (1 - R_rel_inner)
+            return lcTest
+
+        _generate_mesh(meshSizeCallback, 2)
+        # the temporary folder is unique per call (and process) and removed afterwards
+        with tempfile.TemporaryDirectory(prefix="tmp_ellipse_") as tmp_dir:
+            tmp_folder = pathlib.Path(tmp_dir)
+            gmsh_file = tmp_folder / "ellipses.msh"
+            _write_msh(gmsh_file)
+            if cached_msh is not None:
+                _store_msh(gmsh_file, cached_msh)
+
+            # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
+            dmesh, mf1, mf2 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 2, comm)
+    finally:
+        gmsh.model.remove()
+        _set_gmsh_options(gmsh_options)
     # return dolfin mesh, mf1 (1d tags) and mf2 (2d tags)
     return (dmesh, mf1, mf2)
 
@@ -824,6 +997,7 @@ def create_2Dcell(
     comm: MPI.Comm = d.MPI.comm_world,
     verbose: bool = False,
     half_cell: bool = True,
+    cache_dir: Optional[Union[str, pathlib.Path]] = None,
 ) -> Tuple[d.Mesh, d.MeshFunction, d.MeshFunction]:
     """
     Creates a 2D mesh of a cell profile, with the bounding curve defined in
@@ -848,17 +1022,41 @@ def create_2Dcell(
         comm: MPI communicator to create the mesh with
         verbose: If true print gmsh output, else skip
         half_cell: If true, consider r=0 the symmetry axis for an axisymm shape
+        cache_dir: If given, the gmsh mesh is stored in this folder and reused
+            by later calls with the same inputs (and gmsh version) instead of meshing
+            again. Clear the folder if the meshing code is changed
     Returns:
         Tuple (mesh, facet_marker, cell_marker)
     """
     import gmsh
+    from scipy.spatial import cKDTree
 
     if outerExpr == "":
-        ValueError("Outer surface is not defined")
+        raise ValueError("Outer surface is not defined")
+
+    cached_msh = _msh_cache_file(
+        cache_dir,
+        "2DCell",
+        (
+            outerExpr,
+            innerExpr,
+            hEdge,
+            hInnerEdge,
+            interface_marker,
+            outer_marker,
+            inner_tag,
+            outer_tag,
+            half_cell,
+        ),
+    )
+    if cached_msh is not None and cached_msh.is_file():
+        with tempfile.TemporaryDirectory(prefix="tmp_2DCell_") as tmp_dir:
+            return gmsh_to_dolfin(str(cached_msh), pathlib.Path(tmp_dir), 2, comm)
 
     rValsOuter, zValsOuter = implicit_axisymm(outerExpr)
 
-    if not innerExpr == "":
+    has_inner = innerExpr != ""
+    if has_inner:
         rValsInner, zValsInner = implicit_axisymm(innerExpr)
         zMid = np.mean(zValsInner)
         ROuterVec = np.sqrt(rValsOuter**2 + (zValsOuter - zMid) ** 2)
@@ -872,170 +1070,160 @@ def create_2Dcell(
     if np.isclose(hEdge, 0):
         hEdge = 0.1 * maxOuterDim
     if np.isclose(hInnerEdge, 0):
-        hInnerEdge = 0.2 * maxOuterDim if innerExpr == "" else 0.2 * maxInnerDim
+        hInnerEdge = 0.2 * maxInnerDim if has_inner else 0.2 * maxOuterDim
     # Create the 2D mesh using gmsh
-    gmsh.initialize()
-    gmsh.option.setNumber("General.Terminal", int(verbose))
+    gmsh_options = _initialize_gmsh(verbose)
     gmsh.model.add("2DCell")
-    # first add outer body and revolve
-    outer_tag_list = []
-    for i in range(len(rValsOuter)):
-        cur_tag = gmsh.model.occ.add_point(rValsOuter[i], 0, zValsOuter[i])
-        outer_tag_list.append(cur_tag)
-    outer_spline_tag = gmsh.model.occ.add_spline(outer_tag_list)
-    if np.isclose(zValsOuter[-1], 0):  # then include substrate at z=0
-        if half_cell:
-            origin_tag = gmsh.model.occ.add_point(0, 0, 0)
-            symm_axis_tag = gmsh.model.occ.add_line(origin_tag, outer_tag_list[0])
-            bottom_tag = gmsh.model.occ.add_line(origin_tag, outer_tag_list[-1])
-            outer_loop_tag = gmsh.model.occ.add_curve_loop(
-                [outer_spline_tag, bottom_tag, symm_axis_tag]
-            )
+    try:
+        # first add outer body and revolve
+        add_point = gmsh.model.occ.add_point
+        outer_tag_list = [
+            add_point(r, 0, z) for r, z in zip(rValsOuter.tolist(), zValsOuter.tolist())
+        ]
+        outer_spline_tag = gmsh.model.occ.add_spline(outer_tag_list)
+        if np.isclose(zValsOuter[-1], 0):  # then include substrate at z=0
+            if half_cell:
+                origin_tag = gmsh.model.occ.add_point(0, 0, 0)
+                symm_axis_tag = gmsh.model.occ.add_line(origin_tag, outer_tag_list[0])
+                bottom_tag = gmsh.model.occ.add_line(origin_tag, outer_tag_list[-1])
+                outer_loop_tag = gmsh.model.occ.add_curve_loop(
+                    [outer_spline_tag, bottom_tag, symm_axis_tag]
+                )
+            else:
+                bottom_tag = gmsh.model.occ.add_line(outer_tag_list[0], outer_tag_list[-1])
+                outer_loop_tag = gmsh.model.occ.add_curve_loop([outer_spline_tag, bottom_tag])
         else:
-            bottom_tag = gmsh.model.occ.add_line(outer_tag_list[0], outer_tag_list[-1])
-            outer_loop_tag = gmsh.model.occ.add_curve_loop([outer_spline_tag, bottom_tag])
-    else:
-        if half_cell:
-            symm_axis_tag = gmsh.model.occ.add_line(outer_tag_list[0], outer_tag_list[-1])
-            outer_loop_tag = gmsh.model.occ.add_curve_loop([outer_spline_tag, symm_axis_tag])
-        else:
-            outer_loop_tag = gmsh.model.occ.add_curve_loop([outer_spline_tag])
-    cell_plane_tag = gmsh.model.occ.add_plane_surface([outer_loop_tag])
-
-    if innerExpr == "":
-        # No inner shape in this case
-        gmsh.model.occ.synchronize()
-        gmsh.model.add_physical_group(2, cell_plane_tag, tag=outer_tag)
-        facets = gmsh.model.getBoundary([(2, cell_plane_tag)])
-        facet_tag_list = []
-        for i in range(len(facets)):
-            facet_tag_list.append(facets[i][1])
-        if half_cell:  # if half, set symmetry axis to 0 (no flux)
-            rRef = max(rValsOuter)
-            xmin, ymin, zmin = (-rRef / 10, -rRef / 10, -1)
-            xmax, ymax, zmax = (rRef / 10, rRef / 10, max(zValsOuter) + 1)
-            all_symm_bound = gmsh.model.occ.get_entities_in_bounding_box(
-                xmin, ymin, zmin, xmax, ymax, zmax, dim=1
-            )
-            symm_bound_markers = []
-            for i in range(len(all_symm_bound)):
-                symm_bound_markers.append(all_symm_bound[i][1])
-            gmsh.model.add_physical_group(1, symm_bound_markers, tag=0)
-        gmsh.model.add_physical_group(1, facet_tag_list, tag=outer_marker)
-    else:
-        # Add inner shape
-        inner_tag_list = []
-        for i in range(len(rValsInner)):
-            cur_tag = gmsh.model.occ.add_point(rValsInner[i], 0, zValsInner[i])
-            inner_tag_list.append(cur_tag)
-        inner_spline_tag = gmsh.model.occ.add_spline(inner_tag_list)
-        if half_cell:
-            symm_inner_tag = gmsh.model.occ.add_line(inner_tag_list[0], inner_tag_list[-1])
-            inner_loop_tag = gmsh.model.occ.add_curve_loop([inner_spline_tag, symm_inner_tag])
+            if half_cell:
+                symm_axis_tag = gmsh.model.occ.add_line(outer_tag_list[0], outer_tag_list[-1])
+                outer_loop_tag = gmsh.model.occ.add_curve_loop([outer_spline_tag, symm_axis_tag])
+            else:
+                outer_loop_tag = gmsh.model.occ.add_curve_loop([outer_spline_tag])
+        cell_plane_tag = gmsh.model.occ.add_plane_surface([outer_loop_tag])
+
+        if not has_inner:
+            # No inner shape in this case
+            gmsh.model.occ.synchronize()
+            gmsh.model.add_physical_group(2, [cell_plane_tag], tag=outer_tag)
+            facets = gmsh.model.getBoundary([(2, cell_plane_tag)])
+            facet_tag_list = [tag for _, tag in facets]
+            if half_cell:  # if half, set symmetry axis to 0 (no flux)
+                rRef = max(rValsOuter)
+                xmin, ymin, zmin = (-rRef / 10, -rRef / 10, -1)
+                xmax, ymax, zmax = (rRef / 10, rRef / 10, max(zValsOuter) + 1)
+                all_symm_bound = gmsh.model.occ.get_entities_in_bounding_box(
+                    xmin, ymin, zmin, xmax, ymax, zmax, dim=1
+                )
+                symm_bound_markers = [tag for _, tag in all_symm_bound]
+                gmsh.model.add_physical_group(1, symm_bound_markers, tag=0)
+            gmsh.model.add_physical_group(1, facet_tag_list, tag=outer_marker)
         else:
-            inner_loop_tag = gmsh.model.occ.add_curve_loop([inner_spline_tag])
-        inner_plane_tag = gmsh.model.occ.add_plane_surface([inner_loop_tag])
-
-        # Create interface between 2 objects
-        two_shapes, (outer_shape_map, inner_shape_map) = gmsh.model.occ.fragment(
-            [(2, cell_plane_tag)], [(2, inner_plane_tag)]
-        )
-        gmsh.model.occ.synchronize()
-
-        # Get the outer boundary
-        outer_shell = gmsh.model.getBoundary(two_shapes, oriented=False)
-        outer_marker_list = []
-        for i in range(len(outer_shell)):
-            outer_marker_list.append(outer_shell[i][1])
-        # Get the inner boundary
-        inner_shell = gmsh.model.getBoundary(inner_shape_map, oriented=False)
-        inner_marker_list = []
-        for i in range(len(inner_shell)):
-            inner_marker_list.append(inner_shell[i][1])
-        # Add physical markers for facets
-        if half_cell:  # if half, set symmetry axis to 0 (no flux)
-            rRef = max(rValsInner)
-            xmin, ymin, zmin = (-rRef / 10, -rRef / 10, -1)
-            xmax, ymax, zmax = (rRef / 10, rRef / 10, max(zValsOuter) + 1)
-            all_symm_bound = gmsh.model.occ.get_entities_in_bounding_box(
-                xmin, ymin, zmin, xmax, ymax, zmax, dim=1
+            # Add inner shape
+            inner_tag_list = [
+                add_point(r, 0, z) for r, z in zip(rValsInner.tolist(), zValsInner.tolist())
+            ]
+            inner_spline_tag = gmsh.model.occ.add_spline(inner_tag_list)
+            if half_cell:
+                symm_inner_tag = gmsh.model.occ.add_line(inner_tag_list[0], inner_tag_list[-1])
+                inner_loop_tag = gmsh.model.occ.add_curve_loop([inner_spline_tag, symm_inner_tag])
+            else:
+                inner_loop_tag = gmsh.model.occ.add_curve_loop([inner_spline_tag])
+            inner_plane_tag = gmsh.model.occ.add_plane_surface([inner_loop_tag])
+
+            # Create interface between 2 objects
+            two_shapes, (outer_shape_map, inner_shape_map) = gmsh.model.occ.fragment(
+                [(2, cell_plane_tag)], [(2, inner_plane_tag)]
             )
-            symm_bound_markers = []
-            for i in range(len(all_symm_bound)):
-                symm_bound_markers.append(all_symm_bound[i][1])
-            gmsh.model.add_physical_group(1, symm_bound_markers, tag=0)
-        gmsh.model.add_physical_group(1, outer_marker_list, tag=outer_marker)
-        gmsh.model.add_physical_group(1, inner_marker_list, tag=interface_marker)
-
-        # Physical markers for "volumes"
-        all_volumes = [tag[1] for tag in outer_shape_map]
-        inner_volume = [tag[1] for tag in inner_shape_map]
-        outer_volume = []
-        for vol in all_volumes:
-            if vol not in inner_volume:
-                outer_volume.append(vol)
-        gmsh.model.add_physical_group(2, outer_volume, tag=outer_tag)
-        gmsh.model.add_physical_group(2, inner_volume, tag=inner_tag)
-
-    def meshSizeCallback(dim, tag, x, y, z, lc):
-        # mesh length is hEdge at the PM and hInnerEdge at the inner membrane
-        # between these, the value is interpolated based on the relative distance
-        # between the two membranes.
-        # Inside the inner shape, the value is interpolated between hInnerEdge
-        # and lc3, where lc3 = max(hInnerEdge, 0.2*maxInnerDim)
-        # if innerRad=0, then the mesh length is interpolated between
-        # hEdge at the PM and 0.2*maxOuterDim in the center
-        rCur = np.sqrt(x**2 + y**2)
-        RCur = np.sqrt(rCur**2 + (z - zMid) ** 2)
-        outer_dist = np.sqrt((rCur - rValsOuter) ** 2 + (z - zValsOuter) ** 2)
-        np.append(outer_dist, z)  # include the distance from the substrate
-        dist_to_outer = min(outer_dist)
-        if innerExpr == "":
-            lc3 = 0.2 * maxOuterDim
-            dist_to_inner = RCur
-            in_outer = True
-        else:
-            inner_dist = np.sqrt((rCur - rValsInner) ** 2 + (z - zValsInner) ** 2)
-            dist_to_inner = min(inner_dist)
-            inner_idx = np.argmin(inner_dist)
-            inner_rad = RInnerVec[inner_idx]
-            R_rel_inner = RCur / inner_rad
-            lc3 = max(hInnerEdge, 0.2 * maxInnerDim)
-            in_outer = R_rel_inner > 1
+            gmsh.model.occ.synchronize()
+
+            # Get the outer boundary
+            outer_shell = gmsh.model.getBoundary(two_shapes, oriented=False)
+            outer_marker_list = [tag for _, tag in outer_shell]
+            # Get the inner boundary
+            inner_shell = gmsh.model.getBoundary(inner_shape_map, oriented=False)
+            inner_marker_list = [tag for _, tag in inner_shell]
+            # Add physical markers for facets
+            if half_cell:  # if half, set symmetry axis to 0 (no flux)
+                rRef = max(rValsInner)
+                xmin, ymin, zmin = (-rRef / 10, -rRef / 10, -1)
+                xmax, ymax, zmax = (rRef / 10, rRef / 10, max(zValsOuter) + 1)
+                all_symm_bound = gmsh.model.occ.get_entities_in_bounding_box(
+                    xmin, ymin, zmin, xmax, ymax, zmax, dim=1
+                )
+                symm_bound_markers = [tag for _, tag in all_symm_bound]
+                gmsh.model.add_physical_group(1, symm_bound_markers, tag=0)
+            gmsh.model.add_physical_group(1, outer_marker_list, tag=outer_marker)
+            gmsh.model.add_physical_group(1, inner_marker_list, tag=interface_marker)
+
+            # Physical markers for "volumes"
+            all_volumes = [tag[1] for tag in outer_shape_map]
+            inner_volume = [tag[1] for tag in inner_shape_map]
+            inner_volume_set = frozenset(inner_volume)
+            outer_volume = [vol for vol in all_volumes if vol not in inner_volume_set]
+            gmsh.model.add_physical_group(2, outer_volume, tag=outer_tag)
+            gmsh.model.add_physical_group(2, inner_volume, tag=inner_tag)
+
+        # Closest points on the bounding curves are looked up in k-d trees
+        outer_tree = cKDTree(np.column_stack([rValsOuter, zValsOuter]))
+        if has_inner:
+            inner_tree = cKDTree(np.column_stack([rValsInner, zValsInner]))
+
+        # mesh sizes used by the callback do not depend on the point, so compute them once
         lc1 = hEdge
         lc2 = hInnerEdge
-        if in_outer:
-            lcTest = lc1 + (lc2 - lc1) * (dist_to_outer) / (dist_to_inner + dist_to_outer)
-        else:
-            lcTest = lc2 + (lc3 - lc2) * (1 - R_rel_inner)
-        return lcTest
-
-    gmsh.model.mesh.setSizeCallback(meshSizeCallback)
-    # set off the other options for mesh size determination
-    gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
-    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
-    # this changes the algorithm from Frontal-Delaunay to Delaunay,
-    # which may provide better results when there are larger gradients in mesh size
-    gmsh.option.setNumber("Mesh.Algorithm", 5)
-
-    gmsh.model.mesh.generate(2)
-    rank = MPI.COMM_WORLD.rank
-    tmp_folder = pathlib.Path(f"tmp_2DCell_{rank}")
-    tmp_folder.mkdir(exist_ok=True)
-    gmsh_file = tmp_folder / "2DCell.msh"
-    gmsh.write(str(gmsh_file))
-    gmsh.finalize()
-
-    # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
-    dmesh, mf2, mf3 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 2, comm)
-    # remove tmp mesh and tmp folder
-    gmsh_file.unlink(missing_ok=False)
-    tmp_folder.rmdir()
+        lc3 = max(hInnerEdge, 0.2 * maxInnerDim) if has_inner else 0.2 * maxOuterDim
+
+        def meshSizeCallback(dim, tag, x, y, z, lc):
+            # mesh length is hEdge at the PM and hInnerEdge at the inner membrane
+            # between these, the value is interpolated based on the relative distance
+            # between the two membranes.
+            # Inside the inner shape, the value is interpolated between hInnerEdge
+            # and lc3, where lc3 = max(hInnerEdge, 0.2*maxInnerDim)
+            # if innerRad=0, then the mesh length is interpolated between
+            # hEdge at the PM and 0.2*maxOuterDim in the center
+            rCur = math.hypot(x, y)
+            RCur = math.hypot(rCur, z - zMid)
+            dist_to_outer, _ = outer_tree.query((rCur, z))
+            if has_inner:
+                dist_to_inner, inner_idx = inner_tree.query((rCur, z))
+                inner_rad = RInnerVec[inner_idx]
+                R_rel_inner = RCur / inner_rad
+                in_outer = R_rel_inner > 1
+            else:
+                dist_to_inner = RCur
+                in_outer = True
+            if in_outer:
+                lcTest = lc1 + (lc2 - lc1) * (dist_to_outer) / (dist_to_inner + dist_to_outer)
+            else:
+                lcTest = lc2 + (lc3 - lc2) * (1 - R_rel_inner)
+            return lcTest
+
+        _generate_mesh(meshSizeCallback, 2)
+        # the temporary folder is unique per call (and process) and removed afterwards
+        with tempfile.TemporaryDirectory(prefix="tmp_2DCell_") as tmp_dir:
+            tmp_folder = pathlib.Path(tmp_dir)
+            gmsh_file = tmp_folder / "2DCell.msh"
+            _write_msh(gmsh_file)
+            if cached_msh is not None:
+                _store_msh(gmsh_file, cached_msh)
+
+            # return dolfin mesh of max dimension (parent mesh) and marker functions mf2 and mf3
+            dmesh, mf2, mf3 = gmsh_to_dolfin(str(gmsh_file), tmp_folder, 2, comm)
+    finally:
+        gmsh.model.remove()
+        _set_gmsh_options(gmsh_options)
     # return dolfin mesh, mf2 (2d tags) and mf3 (3d tags)
     return (dmesh, mf2, mf3)
 
 
+def _sorted_row_keys(entities: np.ndarray) -> np.ndarray:
+    """
+    Return one sortable key per row of the (N, k) vertex index array `entities`,
+    independent of the order of the vertices within the row
+    """
+    rows = np.ascontiguousarray(np.sort(entities, axis=1), dtype=np.int64)
+    return rows.view(np.dtype([("", np.int64)] * rows.shape[1])).ravel()
+
+
 def gmsh_to_dolfin(
     gmsh_file_name: str,
     tmp_folder: pathlib.Path = pathlib.Path("tmp_folder"),
@@ -1068,7 +1256,7 @@ def gmsh_to_dolfin(
         cell_type = "tetra"
         facet_type = "triangle"
     else:
-        ValueError(f"Mesh of dimension {dimension} not implemented")
+        raise ValueError(f"Mesh of dimension {dimension} not implemented")
     # convert cell mesh
     cells = mesh_in.get_cells_type(cell_type)
     cell_data = mesh_in.get_cell_data("gmsh:physical", cell_type)  # extract values of tags
@@ -1078,18 +1266,8 @@ def gmsh_to_dolfin(
         cell_data={"mf_data": [cell_data]},
     )
     tmp_file_cell = tmp_folder / "tempmesh_cell.xdmf"
-    meshio.write(tmp_file_cell, out_mesh_cell)
-    # convert facet mesh
-    facets = mesh_in.get_cells_type(facet_type)
-    facet_data = mesh_in.get_cell_data("gmsh:physical", facet_type)  # extract values of tags
-    out_mesh_facet = meshio.Mesh(
-        points=mesh_in.points,
-        cells={facet_type: facets},
-        cell_data={"mf_data": [facet_data]},
-    )
-    tmp_file_facet = tmp_folder / "tempmesh_facet.xdmf"
-    meshio.write(tmp_file_facet, out_mesh_facet)
-
+    # the file is only read back once, so skip meshio's default gzip compression
+    meshio.write(tmp_file_cell, out_mesh_cell, file_format="xdmf", compression=None)
     # convert xdmf mesh to dolfin-style mesh
     dmesh = d.Mesh(comm)
     mvc_cell = d.MeshValueCollection("size_t", dmesh, dimension)
@@ -1098,20 +1276,31 @@ def gmsh_to_dolfin(
         infile.read(mvc_cell, "mf_data")
     mf_cell = d.cpp.mesh.MeshFunctionSizet(dmesh, mvc_cell)
     # set unassigned volumes to tag=0
-    mf_cell.array()[np.where(mf_cell.array() > 1e9)[0]] = 0
-
-    mvc_facet = d.MeshValueCollection("size_t", dmesh, dimension - 1)
-    with d.XDMFFile(comm, str(tmp_file_facet)) as infile:
-        infile.read(mvc_facet, "mf_data")
-    mf_facet = d.cpp.mesh.MeshFunctionSizet(dmesh, mvc_facet)
-    # set unassigned faces to tag=0
-    mf_facet.array()[np.where(mf_facet.array() > 1e9)[0]] = 0
-
-    # remove temp meshes
-    tmp_file_cell.unlink(missing_ok=False)
-    tmp_file_cell.with_suffix(".h5").unlink(missing_ok=False)
-    tmp_file_facet.unlink(missing_ok=False)
-    tmp_file_facet.with_suffix(".h5").unlink(missing_ok=False)
+    cell_tags = mf_cell.array()
+    np.putmask(cell_tags, cell_tags > 1e9, 0)
+
+    # convert facet markers directly rather than through a second xdmf file.
+    # Like dolfin's xdmf reader for a MeshValueCollection, facets are matched on their
+    # (sorted) global vertex indices, which are the point indices of the file read above
+    facets = mesh_in.get_cells_type(facet_type)
+    facet_data = mesh_in.get_cell_data("gmsh:physical", facet_type)  # extract values of tags
+    gmsh_keys = _sorted_row_keys(facets)
+    order = np.argsort(gmsh_keys)
+    gmsh_keys, gmsh_tags = gmsh_keys[order], np.asarray(facet_data)[order]
+    dmesh.init(dimension - 1, 0)
+    global_vertices = dmesh.topology().global_indices(0)
+    local_facets = dmesh.topology()(dimension - 1, 0)().reshape(-1, dimension)
+    local_keys = _sorted_row_keys(global_vertices[local_facets])
+    # unassigned faces get tag=0
+    mf_facet = d.MeshFunction("size_t", dmesh, dimension - 1, 0)
+    if len(gmsh_keys) > 0:
+        pos = np.minimum(np.searchsorted(gmsh_keys, local_keys), len(gmsh_keys) - 1)
+        found = gmsh_keys[pos] == local_keys
+        mf_facet.array()[found] = gmsh_tags[pos[found]]
+
+    # remove temp meshes (the builders also remove their whole temporary folder afterwards)
+    for tmp_file in (tmp_file_cell, tmp_file_cell.with_suffix(".h5")):
+        tmp_file.unlink(missing_ok=True)
     # return dolfin mesh and mfs (marker functions)
     return (dmesh, mf_facet, mf_cell)
 
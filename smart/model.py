@@ -10,7 +10,6 @@ import logging
 import dolfin as d
 import numpy as np
 import pandas
-import petsc4py.PETSc as PETSc
 import sympy as sym
 from cached_property import cached_property
 from sympy.parsing.sympy_parser import parse_expr
@@ -117,7 +116,7 @@ class Model:
     def to_pickle(self, filename):
         """Save model information to file by pickling"""
         with open(filename, "wb") as f:
-            pickle.dump(self.to_dict(), f)
+            pickle.dump(self.to_dict(), f, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def from_pickle(cls, filename):
@@ -225,6 +224,13 @@ class Model:
         self.tvec = [self.t]
         self.dtvec = [self.dt]
 
+        # Passed to each form the model compiles, so the global dolfin
+        # parameters (and any forms compiled outside of the model) are left as they are
+        self._form_compiler_parameters = {
+            "cpp_optimize": True,
+            "cpp_optimize_flags": self.config.solver["form_compiler_optimize_flags"],
+        }
+
         self._init_1()
         self._init_2()
         self._init_3()
@@ -1057,13 +1063,12 @@ class Model:
             )
         # FIXME: `has_diffusive_forms` is only in commented out code of
         # `initialize_discrete_variational_problem_and_solver`
+        # compartments with diffusive forms, collected in one pass over the forms
+        diffusive_compartments = {
+            f.compartment.name for f in self.forms if f.form_type == "diffusion"
+        }
         for compartment in self.cc:
-            diffusive_forms = [
-                f
-                for f in self.forms
-                if f.compartment.name == compartment.name and f.form_type == "diffusion"
-            ]
-            if len(diffusive_forms) == 0:
+            if compartment.name not in diffusive_compartments:
                 logger.debug(
                     f"Compartment {compartment.name} has no diffusive forms.",
                     extra=dict(format_type="log"),
@@ -1104,8 +1109,10 @@ class Model:
 
         # Not separating linear/non-linear components (everything assumed non-linear)
         else:
-            self.Fblocks_all = self.get_block_F(self.Fsum_all, u)
-            self.Jblocks_all = self.get_block_J(self.Fsum_all, u)
+            # Splitting the residual into blocks is expensive, so only do it once
+            Fblock = d.extract_blocks(self.Fsum_all)
+            self.Fblocks_all = self.get_block_F(self.Fsum_all, u, Fblock=Fblock)
+            self.Jblocks_all = self.get_block_J(self.Fsum_all, u, Fblock=Fblock)
 
         # Print the residuals per compartment
         for compartment in self._active_compartments:
@@ -1123,6 +1130,8 @@ class Model:
 
         # if use snes
         if self.config.solver["use_snes"]:
+            import petsc4py.PETSc as PETSc
+
             logger.debug("Using SNES solver", extra=dict(format_type="log"))
             self.problem = smartSNESProblem(
                 self.u["u"],
@@ -1298,7 +1307,9 @@ class Model:
                         )
                         Fs.append(d.cpp.fem.Form(1, 0))
                     else:
-                        Fs.append(d.Form(Fsub))
+                        Fs.append(
+                            d.Form(Fsub, form_compiler_parameters=self._form_compiler_parameters)
+                        )
                 Flist.append(Fs)
 
         # Decompose J blocks into subforms based on domain of integration
@@ -1323,7 +1334,7 @@ class Model:
                             f"is empty on integration domain {domain}",
                             extra=dict(format_type="logred"),
                         )
-                    Js.append(d.Form(Jsub))
+                    Js.append(d.Form(Jsub, form_compiler_parameters=self._form_compiler_parameters))
                 Jlist.append(Js)
 
         global_sizes = [uj.function_space().dim() for uj in u]
@@ -1335,12 +1346,16 @@ class Model:
         """Return total number of dof for current model"""
         return [uj.function_space().dim() for uj in u]
 
-    def get_block_F(self, Fsum, u):
+    def get_block_F(self, Fsum, u, Fblock=None):
         """Assemble block F-vector by compartment
         (F is the residual)
+
+        If the blocks of `Fsum` (from :code:`d.extract_blocks`) are already
+        known they can be passed in as `Fblock` to avoid extracting them again.
         """
         # blocks/partitions are by compartment, not species
-        Fblock = d.extract_blocks(Fsum)
+        if Fblock is None:
+            Fblock = d.extract_blocks(Fsum)
 
         # Add in placeholders for empty blocks of F
         if len(Fblock) != len(u):
@@ -1374,17 +1389,23 @@ class Model:
                         )
                         Fs.append(d.cpp.fem.Form(1, 0))
                     else:
-                        Fs.append(d.Form(Fsub))
+                        Fs.append(
+                            d.Form(Fsub, form_compiler_parameters=self._form_compiler_parameters)
+                        )
                 Flist.append(Fs)
 
         return Flist
 
-    def get_block_J(self, Fsum, u):
+    def get_block_J(self, Fsum, u, Fblock=None):
         """Assemble block J by compartment
         (J is the Jacobian)
+
+        If the blocks of `Fsum` (from :code:`d.extract_blocks`) are already
+        known they can be passed in as `Fblock` to avoid extracting them again.
         """
         # blocks/partitions are by compartment, not species
-        Fblock = d.extract_blocks(Fsum)
+        if Fblock is None:
+            Fblock = d.extract_blocks(Fsum)
         J = []
         for Fi in Fblock:
             for uj in u:
@@ -1416,7 +1437,7 @@ class Model:
                             f"is empty on integration domain {domain}",
                             extra=dict(format_type="logred"),
                         )
-                    Js.append(d.Form(Jsub))
+                    Js.append(d.Form(Jsub, form_compiler_parameters=self._form_compiler_parameters))
                 Jlist.append(Js)
 
         return Jlist
@@ -1592,6 +1613,8 @@ class Model:
         )
         self.update_time_dependent_parameters()
         if self.config.solver["use_snes"]:
+            import petsc4py.PETSc as PETSc
+
             logger.info("Solving using PETSc.SNES Solver", dict(format_type="log"))
             self.stopwatches["snes all"].start()
 
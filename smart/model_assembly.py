@@ -2,12 +2,14 @@
 Model class contains functions to efficiently solve a system.
 """
 import dataclasses
+import functools
 import logging
 import numbers
-import sys
 from collections import OrderedDict as odict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from pprint import pformat
 from textwrap import wrap
 from typing import Any, List, Optional, Union
@@ -50,6 +52,20 @@ root = 0
 
 logger = logging.getLogger(__name__)
 
+# Dimensionalities used by the validity checks, parsed once instead of on every instantiation
+_DIFFUSION_DIMENSIONALITY = unit.get_dimensionality("[length]^2/[time]")
+_LENGTH_DIMENSIONALITY = unit.get_dimensionality("[length]")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_expr(expr_str: str) -> sym.Expr:
+    """
+    Parse `expr_str` into a sympy expression. Cached, as the same reaction and
+    parameter expressions are parsed several times while a model is set up
+    (sympy expressions are immutable, so the result can be shared)
+    """
+    return parse_expr(expr_str)
+
 
 # ====================================================
 # ====================================================
@@ -130,25 +146,22 @@ class ObjectContainer:
             # Adding in the ObjectInstance directly
             if isinstance(data, self._ObjectClass):
                 self[data.name] = data
+            elif isinstance(data, dict):
+                for obj_name, obj in data.items():
+                    self[obj_name] = obj
             # Adding in an iterable of ObjectInstances
+            elif isinstance(data, Iterable):
+                # materialize once so that generators are not exhausted by the type check
+                objs = list(data)
+                if not all(isinstance(obj, self._ObjectClass) for obj in objs):
+                    raise InvalidObjectException("Could not add data to ObjectContainer")
+                for obj in objs:
+                    self[obj.name] = obj
             else:
-                # check if input is an iterable and if so add it item by item
-                try:
-                    iter(data)
-                except Exception:
-                    raise TypeError(
-                        "Data being added to ObjectContainer must be either the "
-                        "ObjectClass or an iterator."
-                    )
-                else:
-                    if isinstance(data, dict):
-                        for obj_name, obj in data.items():
-                            self[obj_name] = obj
-                    elif all([isinstance(obj, self._ObjectClass) for obj in data]):
-                        for obj in data:
-                            self[obj.name] = obj
-                    else:
-                        raise InvalidObjectException("Could not add data to ObjectContainer")
+                raise TypeError(
+                    "Data being added to ObjectContainer must be either the "
+                    "ObjectClass or an iterator."
+                )
         # Adding via ObjectInstance arguments
         else:
             obj = self._ObjectClass(*data)
@@ -156,13 +169,18 @@ class ObjectContainer:
 
     def remove(self, name):
         """Remove data from object container"""
-        if type(name) != str:
+        if not isinstance(name, str):
             raise TypeError("Argument must be the name of an object [str] to remove.")
         self.Dict.pop(name)
 
     def get_index(self, idx):
         """Get an element of the object container ordered dict by referencing its index"""
-        return list(self.values)[idx]
+        # walk the values up to idx instead of copying all of them into a list
+        start = idx + self.size if idx < 0 else idx
+        try:
+            return next(islice(self.values, start, None))
+        except (StopIteration, ValueError):
+            raise IndexError(f"Index {idx} is out of range for container of size {self.size}")
 
     # ==============================================================================
     # ObjectContainer - Printing/data-formatting related methods
@@ -180,37 +198,24 @@ class ObjectContainer:
             include_index: If true, add index as the first column in the data-frame.
         """
 
-        df = pandas.DataFrame()
         if include_idx:
             if properties_to_print is not None and "idx" not in properties_to_print:
                 properties_to_print.insert(0, "idx")
-            for idx, (_, instance) in enumerate(self.items):
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    # See https://github.com/hgrecco/pint-pandas/issues/128
-                    df = pandas.concat(
-                        [
-                            df,
-                            instance.get_pandas_series(
-                                properties_to_print=properties_to_print, idx=idx
-                            )
-                            .to_frame()
-                            .T,
-                        ]
-                    )
-        else:
-            for idx, (_, instance) in enumerate(self.items):
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    # See https://github.com/hgrecco/pint-pandas/issues/128
-                    df = pandas.concat(
-                        [
-                            df,
-                            instance.get_pandas_series(properties_to_print=properties_to_print)
-                            .to_frame()
-                            .T,
-                        ]
-                    )
+        # Collect one row per instance and build the data-frame once
+        # (concatenating row by row copies the whole frame for every instance)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            # See https://github.com/hgrecco/pint-pandas/issues/128
+            instances = self.values
+            # without an index the idx cells are left missing (NaN)
+            rows = [
+                instance.get_row_dict(
+                    properties_to_print=properties_to_print, idx=idx if include_idx else np.nan
+                )
+                for idx, instance in enumerate(instances)
+            ]
+            names = [instance.name for instance in instances]
+            df = pandas.DataFrame(rows, index=names, dtype=object)
 
         return df
 
@@ -233,14 +238,13 @@ class ObjectContainer:
         )
 
         # Change certain df entries to best format for display
+        # (the index holds object names, so look at the first row by position)
         for col in df.columns:
             # Convert quantity objects to unit
-            if isinstance(df[col][0], pint.Quantity):
-                # if tablefmt=='latex':
-                df[col] = df[col].apply(lambda x: f"${x:0.{sig_figs}e~Lx}$")
-
-            if col == "idx":
-                df = df.drop("idx", axis=1)
+            if isinstance(df[col].iloc[0], pint.Quantity):
+                df[col] = df[col].map(lambda x: f"${x:0.{sig_figs}e~Lx}$")
+        if "idx" in df.columns:
+            df = df.drop(columns="idx")
 
         if return_df:
             return df
@@ -269,14 +273,11 @@ class ObjectContainer:
         # add new lines to df entries (type str) that exceed max col width
         if max_col_width:
             for col in df.columns:
-                if isinstance(df[col][0], str):
-                    df[col] = df[col].apply(lambda x: "\n".join(wrap(x, max_col_width)))
+                if isinstance(df[col].iloc[0], str):
+                    df[col] = df[col].map(lambda x: "\n".join(wrap(x, max_col_width)))
 
         # remove leading underscores from df column names (used for cached properties)
-        for col in df.columns:
-            # if isinstance(df[col][0], str) and col[0] == '_':
-            if col[0] == "_":
-                df.rename(columns={col: col[1:]}, inplace=True)
+        df = df.rename(columns={col: col[1:] for col in df.columns if col[0] == "_"})
 
         return df
 
@@ -289,6 +290,9 @@ class ObjectContainer:
         sig_figs=2,
     ):
         """Print object properties to file and/or terminal."""
+        # only the root process prints, so the others skip building the data-frame
+        if rank != root:
+            return
 
         df = self.get_pandas_dataframe_formatted(
             properties_to_print=properties_to_print,
@@ -299,9 +303,8 @@ class ObjectContainer:
         # # Change certain df entries to best format for printing
         for col in df.columns:
             # Convert quantity objects to unit
-            if isinstance(df[col][0], pint.Quantity):
-                # if tablefmt=='latex':
-                df[col] = df[col].apply(lambda x: f"{x:0.{sig_figs}e~P}")
+            if isinstance(df[col].iloc[0], pint.Quantity):
+                df[col] = df[col].map(lambda x: f"{x:0.{sig_figs}e~P}")
 
         # print to file
         if filename is None:
@@ -310,13 +313,8 @@ class ObjectContainer:
                 extra=dict(format_type="table"),
             )
         else:
-            original_stdout = sys.stdout  # Save a reference to the original standard output
             with open(filename, "w") as f:  # TODO: Add this to logging
-                # Change the standard output to the file we created.
-                sys.stdout = f
-                print("This message will be written to a file.")
-                print(tabulate(df, headers="keys", tablefmt=tablefmt))  # ,
-                sys.stdout = original_stdout  # Reset the standard output to its original value
+                f.write(tabulate(df, headers="keys", tablefmt=tablefmt) + "\n")
 
     def __str__(self):
         df = self.get_pandas_dataframe(properties_to_print=self.properties_to_print)
@@ -361,6 +359,27 @@ class ObjectInstance:
             if isinstance(attr, pint.Unit):
                 setattr(self, name, unit_to_quantity(attr))
 
+    def get_row_dict(
+        self, properties_to_print: Optional[List[str]] = None, idx: Optional[int] = None
+    ) -> dict:
+        """
+        Collect attributes of the class into a plain dictionary
+        (one row of :meth:`ObjectContainer.get_pandas_dataframe`).
+
+        Args:
+            properties_to_print: If set only the listed properties (by attribute name)
+                is added to the dictionary
+            index: If set add to dictionary
+        """
+        if properties_to_print is not None:
+            row = {"idx": idx}
+            row.update(
+                (key, val) for (key, val) in self.__dict__.items() if key in properties_to_print
+            )
+        else:
+            row = dict(self.__dict__)
+        return row
+
     def get_pandas_series(
         self, properties_to_print: Optional[List[str]] = None, idx: Optional[int] = None
     ):
@@ -372,20 +391,9 @@ class ObjectInstance:
                 is added to the series
             index: If set add to series
         """
-        if properties_to_print is not None:
-            dict_to_convert = odict({"idx": idx})
-            dict_to_convert.update(
-                odict(
-                    [
-                        (key, val)
-                        for (key, val) in self.__dict__.items()
-                        if key in properties_to_print
-                    ]
-                )
-            )
-        else:
-            dict_to_convert = self.__dict__
-        return pandas.Series(dict_to_convert, name=self.name)
+        return pandas.Series(
+            self.get_row_dict(properties_to_print=properties_to_print, idx=idx), name=self.name
+        )
 
     def print(self, properties_to_print=None):
         """Print properties in current object instance."""
@@ -498,7 +506,7 @@ class Parameter(ObjectInstance):
                      first column is time (starting with t=0.0) and second is parameter values
         use_preintegration (optional):  use preintegration in solution process if
                                      "use_preintegration" is true (defaults to false),
-                                     uses sci.integrate.cumtrapz for numerical integration
+                                     uses the cumulative trapezoidal rule for numerical integration
     """
 
     name: str
@@ -545,9 +553,13 @@ class Parameter(ObjectInstance):
         where the first column is time (first entry must be 0.0)
         and the second column is the parameter values.
         Columns should be comma-separated.
+        Large data sets can instead be given as a two-column :code:`.npy` file.
         """
         # load in sampling data file
-        sampling_data = np.genfromtxt(sampling_file, dtype="float", delimiter=",")
+        if str(sampling_file).endswith(".npy"):
+            sampling_data = np.load(sampling_file)
+        else:
+            sampling_data = np.loadtxt(sampling_file, dtype="float", delimiter=",", ndmin=2)
         logger.info(f"Loading in data for parameter {name}", extra=dict(format_type="log"))
         if sampling_data[0, 0] != 0.0 or sampling_data.shape[1] != 2:
             raise NotImplementedError
@@ -563,14 +575,12 @@ class Parameter(ObjectInstance):
         )
 
         if use_preintegration:
-            # preintegrate sampling data using cumtrapz
-            from scipy.integrate import cumtrapz
-
-            int_data = cumtrapz(sampling_data[:, 1], x=sampling_data[:, 0], initial=0)
+            # preintegrate sampling data with the cumulative trapezoidal rule
+            t, values = sampling_data[:, 0], sampling_data[:, 1]
+            int_data = np.zeros_like(values)
+            np.cumsum(np.diff(t) * (values[1:] + values[:-1]) / 2, out=int_data[1:])
             # concatenate time vector
-            preint_sampling_data = np.hstack(
-                sampling_data[:, 0].reshape(-1, 1), int_data.reshape(-1, 1)
-            )
+            preint_sampling_data = np.column_stack((t, int_data))
             parameter.preint_sampling_data = preint_sampling_data
 
         # initialize instance
@@ -615,7 +625,7 @@ class Parameter(ObjectInstance):
         """
         # Parse the given string to create a sympy expression
         if isinstance(sym_expr, str):
-            sym_expr = parse_expr(sym_expr)
+            sym_expr = _parse_expr(sym_expr)
         x, y, z = (Symbol(f"x[{i}]") for i in range(3))
         sym_expr = sym_expr.subs({"x": x, "y": y, "z": z})
 
@@ -645,7 +655,7 @@ class Parameter(ObjectInstance):
         if use_preintegration:
             if preint_sym_expr:
                 if isinstance(preint_sym_expr, str):
-                    preint_sym_expr = parse_expr(preint_sym_expr)
+                    preint_sym_expr = _parse_expr(preint_sym_expr)
                 preint_sym_expr = preint_sym_expr.subs({"x": x, "y": y, "z": z})
             else:
                 # try to integrate
@@ -834,7 +844,7 @@ class Species(ObjectInstance):
         elif isinstance(self.initial_condition, str):
             x, y, z = (Symbol(f"x[{i}]") for i in range(3))
             # Parse the given string to create a sympy expression
-            sym_expr = parse_expr(self.initial_condition).subs({"x": x, "y": y, "z": z})
+            sym_expr = _parse_expr(self.initial_condition).subs({"x": x, "y": y, "z": z})
 
             # Check if expression is space dependent
             free_symbols = [str(x) for x in sym_expr.free_symbols]
@@ -870,7 +880,7 @@ class Species(ObjectInstance):
                 f"Diffusion coefficient for species {self.name} must be greater or equal to 0."
             )
         # checking units
-        if not self.diffusion_units.check("[length]^2/[time]"):
+        if self.diffusion_units.dimensionality != _DIFFUSION_DIMENSIONALITY:
             raise ValueError(
                 f"Units of diffusion coefficient for species {self.name} must "
                 "be dimensionally equivalent to [length]^2/[time]."
@@ -1009,7 +1019,7 @@ class Compartment(ObjectInstance):
                 "Dimensionality must be in [1,2,3]."
             )
         # checking units
-        if not self.compartment_units.check("[length]"):
+        if self.compartment_units.dimensionality != _LENGTH_DIMENSIONALITY:
             raise ValueError(
                 f"Compartment {self.name} has units of {self.compartment_units} "
                 "- units must be dimensionally equivalent to [length]."
@@ -1219,7 +1229,7 @@ class Reaction(ObjectInstance):
             raise TypeError(f"Reaction {self.name} requires a list of strings as input for lhs.")
         if not all([isinstance(x, str) for x in self.rhs]):
             raise TypeError(f"Reaction {self.name} requires a list of strings as input for rhs.")
-        if not all([type(k) == str and type(v) == str for (k, v) in self.param_map.items()]):
+        if not all(isinstance(k, str) and isinstance(v, str) for (k, v) in self.param_map.items()):
             raise TypeError(
                 f"Reaction {self.name} requires a dict of str:str as input for param_map."
             )
@@ -1244,7 +1254,7 @@ class Reaction(ObjectInstance):
 
     def _parse_custom_reaction(self, reaction_eqn_str):
         "Substitute parameters and species into reaction expression"
-        reaction_expr = parse_expr(reaction_eqn_str)
+        reaction_expr = _parse_expr(reaction_eqn_str)
         reaction_expr = reaction_expr.subs(self.param_map)
         reaction_expr = reaction_expr.subs(self.species_map)
         return str(reaction_expr)
@@ -1281,11 +1291,11 @@ class Reaction(ObjectInstance):
             species = self.species[species_name]
             if self.eqn_f_str:
                 flux_name = self.name + f" [{species_name} (f)]"
-                eqn = stoich * parse_expr(self.eqn_f_str)
+                eqn = stoich * _parse_expr(self.eqn_f_str)
                 self.fluxes.update({flux_name: Flux(flux_name, species, eqn, self)})
             if self.eqn_r_str:
                 flux_name = self.name + f" [{species_name} (r)]"
-                eqn = -stoich * parse_expr(self.eqn_r_str)
+                eqn = -stoich * _parse_expr(self.eqn_r_str)
                 self.fluxes.update({flux_name: Flux(flux_name, species, eqn, self)})
 
 
@@ -1349,11 +1359,12 @@ class Flux(ObjectInstance):
         self._post_init_get_involved_species_parameters_compartments()
         self._post_init_get_flux_topology()
 
-        # Get equation lambda expression
+        # Get equation lambda expression (common subexpressions are only built once)
         self.equation_lambda = sym.lambdify(
             list(self.equation_variables.keys()),
             self.equation,
             modules=common.smart_expressions(gset["dolfin_expressions"]),
+            cse=True,
         )
 
         # Update equation with correct unit scale factor
@@ -1515,7 +1526,6 @@ class Flux(ObjectInstance):
                 f"New flux units: {self._expected_flux_units}",
                 extra=dict(new_lines=[0, 1], format_type="log"),
             )
-            print("")
 
     def _post_init_get_integration_measure(self):
         """
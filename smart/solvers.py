@@ -3,7 +3,6 @@ import logging
 from typing import Dict, List, Optional
 
 import dolfin as d
-import petsc4py.PETSc as p
 
 from .common import Stopwatch
 from .model_assembly import Compartment
@@ -77,6 +76,8 @@ class smartSNESProblem:
             (z[::block_size] / block_size).astype("int32")
             for z, block_size in zip(self.lgmaps, self.block_sizes)
         ]
+        import petsc4py.PETSc as p
+
         self.lgmaps_petsc = [
             p.LGMap().create(lgmap, bsize=bsize, comm=self.comm)
             for bsize, lgmap in zip(self.block_sizes, self.lgmaps)
@@ -234,6 +235,8 @@ class smartSNESProblem:
             # We can't use a nest vector
             self.Fpetsc_nest = d.PETScVector(Fpetsc[0]).vec()
         else:
+            import petsc4py.PETSc as p
+
             self.Fpetsc_nest = p.Vec().createNest(Fpetsc, comm=self.comm)
         self.Fpetsc_nest.assemble()
 
@@ -339,8 +342,10 @@ class smartSNESProblem:
             for k in range(len(self.Fforms[j])):
                 # , tensor=d.PETScVector(Fvecs[idx]))
                 Fvecs[j].append(d.as_backend_type(d.assemble_mixed(self.Fforms[j][k])))
-            # TODO: could probably speed this up by not using axpy if there is only one subform
-            # sum the vectors
+            # sum the vectors (a single subform can be copied directly)
+            if len(Fvecs[j]) == 1:
+                Fvecs[j][0].vec().copy(Fj_petsc[j])
+                continue
             Fj_petsc[j].zeroEntries()
             for k in range(len(self.Fforms[j])):
                 Fj_petsc[j].axpy(1, Fvecs[j][k].vec())
@@ -375,6 +380,8 @@ class smartSNESProblem:
             nnz_guess : number of non-zeros (per row) to guess for the matrix
             assemble : whether to assemble the matrix or not (Boolean)
         """
+        import petsc4py.PETSc as p
+
         self.stopwatches["snes initialize zero matrices"].start()
 
         M = p.Mat().create(comm=self.comm)
@@ -413,6 +420,8 @@ class smartSNESProblem:
             j : index
             assemble : whether to assemble the vector or not (Boolean)
         """
+        import petsc4py.PETSc as p
+
         V = p.Vec().create(comm=self.comm)
         V.setSizes((self.local_sizes[j], self.global_sizes[j]))
         V.setUp()
@@ -1,9 +1,31 @@
 """Pint registry from SMART and related convenience function"""
 __all__ = ["unit", "unit_to_quantity", "quantity_to_unit"]
 
+import os
+
 import pint
 
-unit = pint.UnitRegistry()
+
+def _create_registry() -> pint.UnitRegistry:
+    """
+    Create the unit registry. Parsing the unit definitions can be cached on disk
+    (later imports then skip re-parsing them) by setting the environment variable
+    ``SMART_PINT_CACHE_DIR`` to a folder, or to ``:auto:`` for pint's default
+    cache folder. The cache is off by default, so importing SMART does not write files.
+    When running with MPI, fill the cache with a serial import first, as all ranks
+    would otherwise write the same cache files at the same time.
+    """
+    cache_folder = os.environ.get("SMART_PINT_CACHE_DIR")
+    if cache_folder:
+        try:
+            return pint.UnitRegistry(cache_folder=cache_folder)
+        except OSError:
+            # e.g. a read-only cache folder, fall back to parsing the definitions
+            pass
+    return pint.UnitRegistry()
+
+
+unit = _create_registry()
 unit.define("molecule = mol/6.022140857e23")
 unit.define("nM_10 = 10*nM")
 unit.define("nM_100 = 100*nM")
@@ -1,4 +1,3 @@
-import numpy as np
 from pandas import read_json
 from .deprecation import deprecated
 from .model_assembly import (
@@ -34,7 +33,8 @@ def json_to_ObjectContainer(json_file: Union[Path, str], data_type: str):
         raise Exception(f"Cannot find json file: {str(json_file.absolute())}")
 
     df = read_json(json_file).sort_index()
-    df = df.replace({np.nan: None})
+    # NaN -> None with one mask instead of a value-by-value replace
+    df = df.astype(object).where(df.notna(), None)
     if data_type in ["parameters", "parameter", "param", "p"]:
         return ParameterContainer(df)
     elif data_type in ["species", "sp", "spec", "s"]:
@@ -1,3 +1,5 @@
+import pytest
+
 import smart
 
 
@@ -31,3 +33,16 @@ def test_CompartmentContainer(compartment_kwargs_Cyto, compartment_kwargs_PM):
     cc.add([PM])
     assert cc.size == 2
     assert set(cc.keys) == {"Cyto", "PM"}
+
+
+def test_CompartmentContainer_get_index(compartment_kwargs_Cyto, compartment_kwargs_PM):
+    """Test that we can get compartments by their position in the container"""
+    Cyto = smart.model_assembly.Compartment(**compartment_kwargs_Cyto)
+    PM = smart.model_assembly.Compartment(**compartment_kwargs_PM)
+    cc = smart.model_assembly.CompartmentContainer()
+    cc.add([Cyto, PM])
+    assert cc.get_index(0) is Cyto
+    assert cc.get_index(1) is PM
+    assert cc.get_index(-1) is PM
+    with pytest.raises(IndexError):
+        cc.get_index(2)
@@ -0,0 +1,132 @@
+import dolfin as d
+import numpy as np
+import pytest
+
+from smart import mesh_tools
+
+
+def _write_box_msh(gmsh_file, dimension):
+    """Mesh the unit square/cube with gmsh, marking each of its boundary facets differently"""
+    import gmsh
+
+    gmsh_options = mesh_tools._initialize_gmsh()
+    gmsh.model.add("box")
+    try:
+        if dimension == 2:
+            box = gmsh.model.occ.add_rectangle(0, 0, 0, 1, 1)
+        else:
+            box = gmsh.model.occ.add_box(0, 0, 0, 1, 1, 1)
+        gmsh.model.occ.synchronize()
+        boundary = gmsh.model.get_boundary([(dimension, box)], oriented=False)
+        for marker, (_, tag) in enumerate(boundary, start=1):
+            gmsh.model.add_physical_group(dimension - 1, [tag], tag=marker)
+        gmsh.model.add_physical_group(dimension, [box], tag=1)
+        previous = mesh_tools._set_gmsh_options({"Mesh.MeshSizeMax": 0.25})
+        try:
+            gmsh.model.mesh.generate(dimension)
+        finally:
+            mesh_tools._set_gmsh_options(previous)
+        mesh_tools._write_msh(gmsh_file)
+    finally:
+        gmsh.model.remove()
+        mesh_tools._set_gmsh_options(gmsh_options)
+
+
+def _xdmf_facet_markers(gmsh_file, tmp_folder, dmesh, dimension):
+    """Facet markers read back through an XDMF MeshValueCollection (the previous conversion)"""
+    import meshio
+
+    facet_type = "line" if dimension == 2 else "triangle"
+    mesh_in = meshio.read(gmsh_file)
+    out_mesh_facet = meshio.Mesh(
+        points=mesh_in.points,
+        cells={facet_type: mesh_in.get_cells_type(facet_type)},
+        cell_data={"mf_data": [mesh_in.get_cell_data("gmsh:physical", facet_type)]},
+    )
+    tmp_file_facet = tmp_folder / "tempmesh_facet.xdmf"
+    meshio.write(tmp_file_facet, out_mesh_facet)
+    mvc_facet = d.MeshValueCollection("size_t", dmesh, dimension - 1)
+    with d.XDMFFile(dmesh.mpi_comm(), str(tmp_file_facet)) as infile:
+        infile.read(mvc_facet, "mf_data")
+    tags = d.cpp.mesh.MeshFunctionSizet(dmesh, mvc_facet).array()
+    tags[tags > 1e9] = 0
+    return tags
+
+
+@pytest.mark.parametrize("dimension", [2, 3])
+def test_gmsh_to_dolfin_facet_markers(tmp_path, dimension):
+    """Test that facet markers match those read through a MeshValueCollection"""
+    # gmsh and meshio are optional (examples) dependencies
+    pytest.importorskip("gmsh")
+    pytest.importorskip("meshio")
+    gmsh_file = tmp_path / "box.msh"
+    _write_box_msh(gmsh_file, dimension)
+
+    dmesh, mf_facet, mf_cell = mesh_tools.gmsh_to_dolfin(str(gmsh_file), tmp_path, dimension)
+
+    expected = _xdmf_facet_markers(str(gmsh_file), tmp_path, dmesh, dimension)
+    assert np.array_equal(mf_facet.array(), expected)
+    assert set(np.unique(mf_facet.array())) == set(range(2 * dimension + 1))
+    assert np.all(mf_cell.array() == 1)
+
+
+def _sympy_axisymm(boundExpr):
+    """The previous implementation of implicit_axisymm, solving for each point with sympy"""
+    from sympy.parsing.sympy_parser import parse_expr
+    from sympy.solvers.solveset import solveset_real
+    import sympy as sym
+
+    r = sym.Symbol("r", real=True)
+    z = sym.Symbol("z", real=True)
+    z0 = solveset_real(parse_expr(boundExpr).subs({"r": 0, "z": z}), z)
+    rVals = [0.0]
+    zVals = [float(max(z0))]
+    sGap = max(z0) / 100
+    curTan = [1, 0]
+    while rVals[-1] >= 0 and zVals[-1] >= 0:
+        rNext = rVals[-1] + curTan[0] * sGap
+        zNext = zVals[-1] + curTan[1] * sGap
+        zNextSol = list(solveset_real(parse_expr(boundExpr).subs({"r": rNext, "z": z}), z))
+        zNextList = [abs(sol - zNext) for sol in zNextSol]
+        if zNextSol == [] or min(zNextList) > sGap:
+            rNextSol = list(solveset_real(parse_expr(boundExpr).subs({"r": r, "z": zNext}), r))
+            rNextList = [abs(sol - rNext) for sol in rNextSol]
+            rNext = rNextSol[rNextList.index(min(rNextList))]
+        else:
+            zNext = zNextSol[zNextList.index(min(zNextList))]
+        rVals.append(float(rNext))
+        zVals.append(float(zNext))
+        curTan = np.array([rVals[-1] - rVals[-2], zVals[-1] - zVals[-2]])
+        curTan = curTan / np.sqrt(float(curTan[0] ** 2 + curTan[1] ** 2))
+    if rVals[-1] < 0:
+        rVals[-1] = 0
+        zVals[-1] = zVals[-2] + (zVals[-1] - zVals[-2]) * (0 - rVals[-2]) / (rVals[-1] - rVals[-2])
+    elif zVals[-1] < 0:
+        zVals[-1] = 0
+        rVals[-1] = rVals[-2] + (rVals[-1] - rVals[-2]) * (0 - zVals[-2]) / (zVals[-1] - zVals[-2])
+    return (np.array(rVals), np.array(zVals))
+
+
+@pytest.mark.parametrize("boundExpr", ["r**2 + z**2 - 1", "r**2 + (z/2)**2 - 1"])
+def test_implicit_axisymm(boundExpr):
+    """Test that the traced curve matches the one found by solving with sympy"""
+    rVals, zVals = mesh_tools.implicit_axisymm(boundExpr)
+    rRef, zRef = _sympy_axisymm(boundExpr)
+
+    assert (rVals[0], zVals[0]) == (rRef[0], zRef[0])
+    assert np.allclose((rVals[-1], zVals[-1]), (rRef[-1], zRef[-1]), atol=1e-4)
+    length = np.sum(np.hypot(np.diff(rVals), np.diff(zVals)))
+    length_ref = np.sum(np.hypot(np.diff(rRef), np.diff(zRef)))
+    assert np.isclose(length, length_ref, rtol=1e-5)
+    _, f, _, _ = mesh_tools._compile_bound(boundExpr)
+    assert np.allclose(f(rVals, zVals), 0, atol=1e-3)
+
+
+def test_compile_bound_is_cached():
+    """Test that a curve expression is only parsed once"""
+    boundExpr = "r**2 + (z/3)**2 - 1"
+    first = mesh_tools._compile_bound(boundExpr)
+    hits = mesh_tools._compile_bound.cache_info().hits
+    assert mesh_tools._compile_bound(boundExpr) is first
+    assert mesh_tools._compile_bound.cache_info().hits == hits + 1
+    assert first[0] == 3.0
@@ -1,5 +1,6 @@
 import math
 import numpy as np
+import pandas
 import pytest
 import sympy as sym
 
@@ -69,3 +70,88 @@ def test_ParameterContainer(parameter_kwargs_k3f):
     pc.add([k3r])
     assert pc.size == 2
     assert set(pc.keys) == {"k3f", "k3r"}
+
+
+@pytest.mark.parametrize("use_preintegration", [True, False])
+@pytest.mark.parametrize("suffix", [".txt", ".npy"])
+def test_Parameter_from_file(tmp_path, use_preintegration, suffix):
+    """Test that sampling files load and preintegrate as with genfromtxt and cumtrapz"""
+    try:
+        from scipy.integrate import cumulative_trapezoid
+    except ImportError:
+        from scipy.integrate import cumtrapz as cumulative_trapezoid
+
+    t = np.linspace(0.0, 2.0, 21)
+    data = np.column_stack((t, 1.0 + np.sin(3 * t)))
+    txt_file = tmp_path / "data.txt"
+    np.savetxt(txt_file, data, delimiter=",")
+    expected = np.genfromtxt(txt_file, dtype="float", delimiter=",")
+    sampling_file = txt_file
+    if suffix == ".npy":
+        sampling_file = tmp_path / "data.npy"
+        np.save(sampling_file, data)
+
+    param = smart.model_assembly.Parameter.from_file(
+        "j", sampling_file, 1 / smart.units.unit.sec, use_preintegration=use_preintegration
+    )
+
+    assert np.array_equal(param.sampling_data, expected)
+    assert math.isclose(param.value, expected[0, 1])
+    assert param.is_time_dependent is True
+    if use_preintegration:
+        int_ref = cumulative_trapezoid(expected[:, 1], x=expected[:, 0], initial=0)
+        assert param.preint_sampling_data.shape == (len(t), 2)
+        assert np.array_equal(param.preint_sampling_data[:, 0], expected[:, 0])
+        assert np.allclose(param.preint_sampling_data[:, 1], int_ref)
+
+
+def test_ParameterContainer_add_generator(parameter_kwargs_k3f):
+    """Test that adding a generator of parameters adds all of them"""
+    k3f = smart.model_assembly.Parameter(**parameter_kwargs_k3f)
+    k3r = smart.model_assembly.Parameter("k3r", 100, 1 / smart.units.unit.sec)
+    pc = smart.model_assembly.ParameterContainer()
+    pc.add(param for param in [k3f, k3r])
+    assert pc.size == 2
+    assert set(pc.keys) == {"k3f", "k3r"}
+
+
+def _concat_dataframe(container, properties_to_print=None, include_idx=True):
+    """The previous construction of get_pandas_dataframe, concatenating one row at a time"""
+    df = pandas.DataFrame()
+    if include_idx and properties_to_print is not None and "idx" not in properties_to_print:
+        properties_to_print = ["idx"] + properties_to_print
+    for idx, instance in enumerate(container.values):
+        kwargs = dict(idx=idx) if include_idx else dict()
+        series = instance.get_pandas_series(properties_to_print=properties_to_print, **kwargs)
+        df = pandas.concat([df, series.to_frame().T])
+    return df
+
+
+@pytest.mark.parametrize("include_idx", [True, False])
+def test_ParameterContainer_get_pandas_dataframe(parameter_kwargs_k3f, include_idx):
+    """Test that the data-frame matches the one built by concatenating rows"""
+    k3f = smart.model_assembly.Parameter(**parameter_kwargs_k3f)
+    k3r = smart.model_assembly.Parameter("k3r", 100, 1 / smart.units.unit.sec)
+    pc = smart.model_assembly.ParameterContainer()
+    pc.add([k3f, k3r])
+    properties = ["name", "value", "group"]
+
+    df = pc.get_pandas_dataframe(properties_to_print=list(properties), include_idx=include_idx)
+    expected = _concat_dataframe(pc, properties_to_print=list(properties), include_idx=include_idx)
+
+    assert list(df.index) == list(expected.index) == ["k3f", "k3r"]
+    assert list(df.columns) == list(expected.columns) == ["idx"] + properties
+    # missing cells may be None or NaN depending on the pandas version
+    pandas.testing.assert_frame_equal(
+        df.where(df.notna(), None), expected.astype(object).where(expected.notna(), None)
+    )
+    if include_idx:
+        assert list(df["idx"]) == [0, 1]
+    else:
+        # without an index the idx cells are NaN
+        assert all(isinstance(idx, float) and math.isnan(idx) for idx in df["idx"])
+
+    full = pc.get_pandas_dataframe(include_idx=include_idx)
+    full_expected = _concat_dataframe(pc, include_idx=include_idx)
+    assert list(full.index) == list(full_expected.index)
+    assert list(full.columns) == list(full_expected.columns)